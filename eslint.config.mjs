@@ -32,6 +32,7 @@ export default [
 				clearTimeout: 'readonly',
 				setInterval: 'readonly',
 				clearInterval: 'readonly',
+				performance: 'readonly',
 				// Browser globals
 				navigator: 'readonly',
 				alert: 'readonly',
@@ -42,6 +43,11 @@ export default [
 				ClipboardItem: 'readonly',
 				fetch: 'readonly',
 				TextEncoder: 'readonly',
+				AbortController: 'readonly',
+				AbortSignal: 'readonly',
+				requestAnimationFrame: 'readonly',
+				cancelAnimationFrame: 'readonly',
+				Intl: 'readonly',
 				// DOM types
 				HTMLDetailsElement: 'readonly',
 				HTMLDivElement: 'readonly',
@@ -1,29 +1,71 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef, lazy, Suspense } from 'react';
 import Navbar from './components/layout/Navbar';
 import RepositorySection from './components/repository/RepositorySection';
 import OutputSection from './components/review/OutputSection';
-import ConfigModal from './components/config/ConfigModal';
 import ProgressTracker from './components/review/ProgressTracker';
-import { AppState, AIProviderConfig, WorktreeInfo } from './types';
+import { AppState, AIProviderConfig, ProgressData, WorktreeInfo } from './types';
 import { buildWorktreePrompt } from './utils/prompts';
+import { INCOMPLETE_REVIEW_MESSAGE } from './providers/IAIProvider';
+import { useShallow } from 'zustand/react/shallow';
 import { useTokenStore } from './store/tokenStore';
 import { useConfigStore } from './store/configStore';
 import { useRepositoryStore } from './store/repositoryStore';
 import { calculateTotalSize } from './utils/fileScanner';
 
+// Settings (and its provider/prompt editors) are only needed once the user opens them
+const ConfigModal = lazy(() => import('./components/config/ConfigModal'));
+
+interface ReviewStats {
+	tokens: number;
+	inputTokens: number;
+	outputTokens: number;
+	tokensPerSecond: number;
+	processingTime: number;
+	responseTime: number;
+	stage: string;
+	progress: number;
+	message?: string;
+}
+
+const areReviewStatsEqual = (a: ReviewStats | null, b: ReviewStats): boolean =>
+	a !== null && (Object.keys(b) as (keyof ReviewStats)[]).every((key) => a[key] === b[key]);
+
 const App: React.FC = () => {
+	// Select only what App uses: live session counts change on every progress frame and must not re-render the whole tree
 	const {
 		setEstimatedInputTokens: setStoreEstimatedTokens,
-		setCurrentSessionInputTokens,
-		setCurrentSessionOutputTokens,
+		setCurrentSessionTokens,
 		addToTotalInputTokens,
 		addToTotalOutputTokens,
 		resetCurrentSession,
 		estimatedInputTokens: storeEstimatedTokens,
-	} = useTokenStore();
+	} = useTokenStore(
+		useShallow((state) => ({
+			setEstimatedInputTokens: state.setEstimatedInputTokens,
+			setCurrentSessionTokens: state.setCurrentSessionTokens,
+			addToTotalInputTokens: state.addToTotalInputTokens,
+			addToTotalOutputTokens: state.addToTotalOutputTokens,
+			resetCurrentSession: state.resetCurrentSession,
+			estimatedInputTokens: state.estimatedInputTokens,
+		}))
+	);
 
-	const { aiConfig, basePrompt, userPrompt, debugMode, azureRateLimitTokensPerMinute } = useConfigStore();
-	const { activeWorktree, setActiveWorktree, clearActiveWorktree } = useRepositoryStore();
+	const { aiConfig, basePrompt, userPrompt, debugMode, azureRateLimitTokensPerMinute } = useConfigStore(
+		useShallow((state) => ({
+			aiConfig: state.aiConfig,
+			basePrompt: state.basePrompt,
+			userPrompt: state.userPrompt,
+			debugMode: state.debugMode,
+			azureRateLimitTokensPerMinute: state.azureRateLimitTokensPerMinute,
+		}))
+	);
+	const { activeWorktree, setActiveWorktree, clearActiveWorktree } = useRepositoryStore(
+		useShallow((state) => ({
+			activeWorktree: state.activeWorktree,
+			setActiveWorktree: state.setActiveWorktree,
+			clearActiveWorktree: state.clearActiveWorktree,
+		}))
+	);
 	const [appState, setAppState] = useState<AppState>({
 		currentRepoPath: null,
 		reviewInProgress: false,
@@ -40,17 +82,7 @@ const App: React.FC = () => {
 		message: string;
 		provider?: string;
 	} | null>(null);
-	const [reviewStats, setReviewStats] = useState<{
-		tokens: number;
-		inputTokens: number;
-		outputTokens: number;
-		tokensPerSecond: number;
-		processingTime: number;
-		responseTime: number;
-		stage: string;
-		progress: number;
-		message?: string;
-	} | null>(null);
+	const [reviewStats, setReviewStats] = useState<ReviewStats | null>(null);
 
 	const [estimatedInputTokens, setEstimatedInputTokens] = useState<number>(0);
 	const [chunkingInfo, setChunkingInfo] = useState<{
@@ -59,62 +91,92 @@ const App: React.FC = () => {
 		currentChunk: number;
 	}>({ willChunk: false, chunkCount: 0, currentChunk: 0 });
 	const [isCalculatingTokens, setIsCalculatingTokens] = useState<boolean>(false);
+	const stopRequestedRef = useRef<boolean>(false);
+	// Set when the review came from the cache, so no tokens are added to the totals
+	const reviewCachedRef = useRef<boolean>(false);
+	// Mode of the last review, so Regenerate repeats the same kind of review
+	const lastReviewUncommittedRef = useRef<boolean>(false);
+	const tokenRequestIdRef = useRef(0);
+	const pendingStreamTextRef = useRef<string>('');
+	const streamFlushTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+	// Streamed text is buffered and written to the output at most every 50ms,
+	// so a fast model does not trigger a markdown re-render per token
+	const queueStreamingText = useCallback((delta: string) => {
+		pendingStreamTextRef.current += delta;
+		if (streamFlushTimerRef.current) return;
+
+		streamFlushTimerRef.current = setTimeout(() => {
+			streamFlushTimerRef.current = null;
+			// After Stop, text stays pending until the request has ended and the stop handler appends it
+			if (stopRequestedRef.current) return;
+			const text = pendingStreamTextRef.current;
+			pendingStreamTextRef.current = '';
+			setAppState((prev) => (prev.reviewInProgress ? { ...prev, currentOutputMarkdown: prev.currentOutputMarkdown + text } : prev));
+		}, 50);
+	}, []);
+
+	const discardStreamingText = useCallback(() => {
+		if (streamFlushTimerRef.current) {
+			clearTimeout(streamFlushTimerRef.current);
+			streamFlushTimerRef.current = null;
+		}
+		pendingStreamTextRef.current = '';
+	}, []);
+
+	const pendingProgressRef = useRef<{ stats: ReviewStats; inputTokens: number; outputTokens: number } | null>(null);
+	const progressFrameRef = useRef<number | null>(null);
+
+	// Progress events can arrive many times per frame; keep only the latest and apply it once per animation frame
+	const queueProgress = useCallback(
+		(stats: ReviewStats, inputTokens: number, outputTokens: number) => {
+			pendingProgressRef.current = { stats, inputTokens, outputTokens };
+			if (progressFrameRef.current !== null) return;
+
+			progressFrameRef.current = requestAnimationFrame(() => {
+				progressFrameRef.current = null;
+				const pending = pendingProgressRef.current;
+				pendingProgressRef.current = null;
+				if (!pending) return;
+
+				// Keep the previous object when nothing changed so React can bail out of the re-render
+				setReviewStats((prev) => (areReviewStatsEqual(prev, pending.stats) ? prev : pending.stats));
+				setCurrentSessionTokens(pending.inputTokens, pending.outputTokens);
+			});
+		},
+		[setCurrentSessionTokens]
+	);
 
-	// Set up progress listeners with access to current estimatedInputTokens
-	useEffect(() => {
-		const ollamaProgressCleanup = window.electronAPI.onOllamaProgress((event, data) => {
-			setReviewStats((_prevStats) => ({
-				tokens: data.tokens || 0,
-				inputTokens: data.actualInputTokens ?? (data.stage === 'complete' ? 0 : estimatedInputTokens),
-				outputTokens: data.actualOutputTokens || data.tokens || 0,
-				tokensPerSecond: data.tokensPerSecond || 0,
-				processingTime: data.processingTime || 0,
-				responseTime: data.responseTime || 0,
-				stage: data.stage || data.message || '',
-				progress: data.progress || 0,
-				message: data.message,
-			}));
-
-			// Update current session tokens live during review
-			setCurrentSessionInputTokens(data.actualInputTokens || storeEstimatedTokens);
-			setCurrentSessionOutputTokens(data.actualOutputTokens || data.tokens || 0);
-
-			// Update total tokens when review completes (try multiple completion indicators)
-			if ((data.stage === 'complete' || data.progress === 100) && (data.actualInputTokens || data.actualOutputTokens)) {
-				const newInputTokens = data.actualInputTokens || storeEstimatedTokens;
-				const newOutputTokens = data.actualOutputTokens || data.tokens || 0;
+	const discardQueuedProgress = useCallback(() => {
+		if (progressFrameRef.current !== null) {
+			cancelAnimationFrame(progressFrameRef.current);
+			progressFrameRef.current = null;
+		}
+		pendingProgressRef.current = null;
+	}, []);
 
-				console.log('Updating total tokens from progress listener:', {
-					stage: data.stage,
-					progress: data.progress,
-					inputTokens: newInputTokens,
-					outputTokens: newOutputTokens,
-				});
+	// Token estimates are read through refs so the IPC progress listeners are registered once,
+	// rather than torn down and re-added every time the estimate is recalculated
+	const estimatedInputTokensRef = useRef(estimatedInputTokens);
+	const storeEstimatedTokensRef = useRef(storeEstimatedTokens);
+	useEffect(() => {
+		estimatedInputTokensRef.current = estimatedInputTokens;
+		storeEstimatedTokensRef.current = storeEstimatedTokens;
+	}, [estimatedInputTokens, storeEstimatedTokens]);
 
-				if (newInputTokens > 0) {
-					addToTotalInputTokens(newInputTokens);
-					console.log('Added input tokens to total:', newInputTokens);
-				}
+	// Same for the debug flag: toggling it must not re-register listeners or trigger a new token estimate
+	const debugModeRef = useRef(debugMode);
+	useEffect(() => {
+		debugModeRef.current = debugMode;
+	}, [debugMode]);
 
-				if (newOutputTokens > 0) {
-					addToTotalOutputTokens(newOutputTokens);
-					console.log('Added output tokens to total:', newOutputTokens);
-				}
+	// Set up progress listeners
+	useEffect(() => {
+		// Shared by both providers, including which chunk of a large diff is being processed
+		const handleProgress = (data: ProgressData) => {
+			if (data.cached) {
+				reviewCachedRef.current = true;
 			}
-		});
-
-		const azureProgressCleanup = window.electronAPI.onAzureAIProgress((event, data) => {
-			setReviewStats((_prevStats) => ({
-				tokens: data.tokens || 0,
-				inputTokens: data.actualInputTokens ?? (data.stage === 'complete' ? 0 : estimatedInputTokens),
-				outputTokens: data.actualOutputTokens || data.tokens || 0,
-				tokensPerSecond: data.tokensPerSecond || 0,
-				processingTime: data.processingTime || 0,
-				responseTime: data.responseTime || 0,
-				stage: data.stage || data.message || '',
-				progress: data.progress || 0,
-				message: data.message,
-			}));
 
 			// Update chunk progress only when actually processing a chunk (not when waiting)
 			if (data.stage === 'processing-chunk' && data.message) {
@@ -130,48 +192,90 @@ const App: React.FC = () => {
 				}
 			}
 
-			// Update current session tokens live during review
-			setCurrentSessionInputTokens(data.actualInputTokens || storeEstimatedTokens);
-			setCurrentSessionOutputTokens(data.actualOutputTokens || data.tokens || 0);
+			const stats: ReviewStats = {
+				tokens: data.tokens || 0,
+				inputTokens: data.actualInputTokens ?? (data.stage === 'complete' ? 0 : estimatedInputTokensRef.current),
+				outputTokens: data.actualOutputTokens || data.tokens || 0,
+				tokensPerSecond: data.tokensPerSecond || 0,
+				processingTime: data.processingTime || 0,
+				responseTime: data.responseTime || 0,
+				stage: data.stage || data.message || '',
+				// Whole percent is all the bar can show; sub-percent changes would only cause redundant renders
+				progress: Math.round(data.progress || 0),
+				message: data.message,
+			};
+
+			// Show the review as it streams in; the final result replaces it on completion
+			if (data.streamingDelta) {
+				queueStreamingText(data.streamingDelta);
+			}
+
+			// Update stats and current session tokens live during review
+			// A cached review used no tokens, so it must not count the estimate for this session either
+			queueProgress(stats, data.cached ? 0 : data.actualInputTokens || storeEstimatedTokensRef.current, data.actualOutputTokens || data.tokens || 0);
 
 			// Update total tokens when review completes (try multiple completion indicators)
 			if ((data.stage === 'complete' || data.progress === 100) && (data.actualInputTokens || data.actualOutputTokens)) {
-				const newInputTokens = data.actualInputTokens || storeEstimatedTokens;
+				const newInputTokens = data.actualInputTokens || storeEstimatedTokensRef.current;
 				const newOutputTokens = data.actualOutputTokens || data.tokens || 0;
 
-				console.log('Updating total tokens from progress listener:', {
-					stage: data.stage,
-					progress: data.progress,
-					inputTokens: newInputTokens,
-					outputTokens: newOutputTokens,
-				});
+				if (debugModeRef.current) {
+					console.log('Updating total tokens from progress listener:', {
+						stage: data.stage,
+						progress: data.progress,
+						inputTokens: newInputTokens,
+						outputTokens: newOutputTokens,
+					});
+				}
 
 				if (newInputTokens > 0) {
 					addToTotalInputTokens(newInputTokens);
-					console.log('Added input tokens to total:', newInputTokens);
 				}
 
 				if (newOutputTokens > 0) {
 					addToTotalOutputTokens(newOutputTokens);
-					console.log('Added output tokens to total:', newOutputTokens);
 				}
 			}
-		});
+		};
+
+		const ollamaProgressCleanup = window.electronAPI.onOllamaProgress((_event, data) => handleProgress(data));
+
+		const azureProgressCleanup = window.electronAPI.onAzureAIProgress((_event, data) => handleProgress(data));
 
 		// Cleanup listeners on unmount
 		return () => {
 			ollamaProgressCleanup();
 			azureProgressCleanup();
 		};
-	}, [estimatedInputTokens, storeEstimatedTokens, setCurrentSessionInputTokens, setCurrentSessionOutputTokens, addToTotalInputTokens, addToTotalOutputTokens]);
+	}, [queueProgress, addToTotalInputTokens, addToTotalOutputTokens, queueStreamingText]);
+
+	// Drop a progress frame still pending when the app unmounts
+	useEffect(() => discardQueuedProgress, [discardQueuedProgress]);
+
+	// Load the Ollama model in the background so the first review does not pay the cold-start cost
+	useEffect(() => {
+		if (aiConfig.provider !== 'ollama' || !aiConfig.ollama.url || !aiConfig.ollama.model) return;
+
+		const timer = setTimeout(() => {
+			window.electronAPI.warmupOllama(aiConfig.ollama.url, aiConfig.ollama.model).catch(() => {});
+		}, 1000);
+
+		return () => clearTimeout(timer);
+	}, [aiConfig.provider, aiConfig.ollama.url, aiConfig.ollama.model]);
 
 	const calculateTokens = useCallback(async () => {
+		// Only the latest request may update state; an older one can finish (or be cancelled) after it
+		const requestId = ++tokenRequestIdRef.current;
+		const isStale = () => requestId !== tokenRequestIdRef.current;
+
 		if (!appState.currentRepoPath || !fromBranch || !toBranch || fromBranch === toBranch) {
-			console.log('calculateInputTokens: Missing requirements', {
-				repoPath: appState.currentRepoPath,
-				fromBranch,
-				toBranch,
-			});
+			if (debugModeRef.current) {
+				console.log('calculateInputTokens: Missing requirements', {
+					repoPath: appState.currentRepoPath,
+					fromBranch,
+					toBranch,
+				});
+			}
 			setEstimatedInputTokens(0);
 			setStoreEstimatedTokens(0);
 			setChunkingInfo({ willChunk: false, chunkCount: 0, currentChunk: 0 });
@@ -182,22 +286,14 @@ const App: React.FC = () => {
 		setIsCalculatingTokens(true);
 
 		try {
-			console.log('calculateInputTokens: Getting diff...');
-			const diff = await window.electronAPI.getGitDiff(appState.currentRepoPath, fromBranch, toBranch);
-			if (!diff || diff.trim() === '') {
-				console.log('calculateInputTokens: No diff found');
-				setEstimatedInputTokens(0);
-				setStoreEstimatedTokens(0);
-				setChunkingInfo({ willChunk: false, chunkCount: 0, currentChunk: 0 });
-				return;
+			// The diff stays in the main process; only the token estimate comes back
+			// The Azure chunk size follows the rate limit; Ollama uses its own fixed chunk size
+			const chunkConfig = aiConfig.provider === 'azure' ? { maxTokensPerChunk: azureRateLimitTokensPerMinute } : undefined;
+			const result = await window.electronAPI.calculateDiffTokens(appState.currentRepoPath, fromBranch, toBranch, basePrompt, userPrompt, aiConfig.provider, chunkConfig);
+			if (isStale()) return;
+			if (debugModeRef.current) {
+				console.log('calculateInputTokens: Result:', result);
 			}
-
-			console.log('calculateInputTokens: Calculating tokens in main process...');
-			const result = await window.electronAPI.calculateTokensWithChunking(diff, basePrompt, userPrompt, aiConfig.provider, {
-				maxTokensPerChunk: azureRateLimitTokensPerMinute,
-			});
-
-			console.log('calculateInputTokens: Result:', result);
 			setEstimatedInputTokens(result.estimatedTokens);
 			setStoreEstimatedTokens(result.estimatedTokens);
 			setChunkingInfo({
@@ -206,12 +302,15 @@ const App: React.FC = () => {
 				currentChunk: 0,
 			});
 		} catch (error) {
+			if (isStale()) return;
 			console.error('Error calculating input tokens:', error);
 			setEstimatedInputTokens(0);
 			setStoreEstimatedTokens(0);
 			setChunkingInfo({ willChunk: false, chunkCount: 0, currentChunk: 0 });
 		} finally {
-			setIsCalculatingTokens(false);
+			if (!isStale()) {
+				setIsCalculatingTokens(false);
+			}
 		}
 	}, [appState.currentRepoPath, fromBranch, toBranch, basePrompt, userPrompt, aiConfig.provider, azureRateLimitTokensPerMinute, setStoreEstimatedTokens]);
 
@@ -224,7 +323,8 @@ const App: React.FC = () => {
 		return () => clearTimeout(timer);
 	}, [calculateTokens]);
 
-	const handleStartReview = async (reviewUncommitted: boolean = false) => {
+	// skipCache asks the model again even when the same prompt was reviewed before
+	const handleStartReview = async (reviewUncommitted: boolean = false, skipCache: boolean = false) => {
 		if (!appState.currentRepoPath) {
 			alert('Please select a repository before starting the review.');
 			return;
@@ -235,6 +335,17 @@ const App: React.FC = () => {
 			return;
 		}
 
+		// The target (base) branch can disappear after the list was loaded (e.g. pruned by a fetch); fail fast with a clear message
+		if (!reviewUncommitted && !(await window.electronAPI.branchExists(appState.currentRepoPath, toBranch))) {
+			alert(`The target branch "${toBranch}" no longer exists. Refresh the branch list and select another target branch.`);
+			return;
+		}
+
+		stopRequestedRef.current = false;
+		reviewCachedRef.current = false;
+		lastReviewUncommittedRef.current = reviewUncommitted;
+		discardStreamingText();
+		discardQueuedProgress();
 		setAppState((prev) => ({
 			...prev,
 			reviewInProgress: true,
@@ -248,6 +359,21 @@ const App: React.FC = () => {
 
 		let worktree: WorktreeInfo | null = null;
 
+		// Git and scan stages can't be aborted mid-call, so check between them; a stop pressed
+		// while preparing must not go on to send the prompt to the AI provider
+		const stopIfRequested = async (): Promise<boolean> => {
+			if (!stopRequestedRef.current) return false;
+
+			if (worktree) {
+				try {
+					await window.electronAPI.deleteWorktree(worktree.path);
+				} catch (cleanupError) {
+					console.error('Failed to cleanup worktree after stop:', cleanupError);
+				}
+			}
+			return true;
+		};
+
 		try {
 			if (debugMode) {
 				console.log('=== Review Debug Info ===');
@@ -266,6 +392,8 @@ const App: React.FC = () => {
 
 			let changedFiles: string[];
 			let scannedFiles;
+			// Set instead of scanning files when an Ollama review is too large for one request
+			let chunkedDiff: string | null = null;
 
 			if (reviewUncommitted) {
 				// Review uncommitted changes in working directory
@@ -274,6 +402,7 @@ const App: React.FC = () => {
 				}
 
 				changedFiles = await window.electronAPI.getUncommittedChanges(appState.currentRepoPath);
+				if (await stopIfRequested()) return;
 
 				if (debugMode) {
 					console.log('Uncommitted files:', changedFiles);
@@ -308,6 +437,7 @@ const App: React.FC = () => {
 				}
 
 				changedFiles = await window.electronAPI.getChangedFiles(appState.currentRepoPath, fromBranch, toBranch);
+				if (await stopIfRequested()) return;
 
 				if (debugMode) {
 					console.log('Changed files:', changedFiles);
@@ -322,33 +452,45 @@ const App: React.FC = () => {
 					return;
 				}
 
-				// Create worktree for the feature branch (fromBranch)
-				if (debugMode) {
-					console.log('Creating worktree for branch:', fromBranch);
-				}
+				if (aiConfig.provider === 'ollama' && chunkingInfo.willChunk) {
+					// Full file contents can't be split across requests, so review the diff chunk by chunk instead
+					if (debugMode) {
+						console.log('Reviewing diff in chunks:', { chunkCount: chunkingInfo.chunkCount });
+					}
 
-				worktree = await window.electronAPI.createWorktree(appState.currentRepoPath, fromBranch);
+					chunkedDiff = await window.electronAPI.getGitDiff(appState.currentRepoPath, fromBranch, toBranch);
+				} else {
+					// Create worktree for the feature branch (fromBranch)
+					if (debugMode) {
+						console.log('Creating worktree for branch:', fromBranch);
+					}
 
-				if (debugMode) {
-					console.log('Worktree created:', worktree);
-				}
+					worktree = await window.electronAPI.createWorktree(appState.currentRepoPath, fromBranch);
+					if (await stopIfRequested()) return;
 
-				// Scan only the changed files in the worktree
-				if (debugMode) {
-					console.log(`Scanning ${changedFiles.length} changed files in worktree...`);
-				}
+					if (debugMode) {
+						console.log('Worktree created:', worktree);
+					}
 
-				scannedFiles = await window.electronAPI.scanChangedFiles(worktree.path, changedFiles);
+					// Scan only the changed files in the worktree
+					if (debugMode) {
+						console.log(`Scanning ${changedFiles.length} changed files in worktree...`);
+					}
 
-				if (debugMode) {
-					console.log('Scanned files:', {
-						count: scannedFiles.length,
-						totalSize: calculateTotalSize(scannedFiles),
-					});
+					scannedFiles = await window.electronAPI.scanChangedFiles(worktree.path, changedFiles);
+
+					if (debugMode) {
+						console.log('Scanned files:', {
+							count: scannedFiles.length,
+							totalSize: calculateTotalSize(scannedFiles),
+						});
+					}
 				}
 			}
 
-			if (scannedFiles.length === 0) {
+			if (await stopIfRequested()) return;
+
+			if (chunkedDiff === null && !scannedFiles?.length) {
 				setAppState((prev) => ({
 					...prev,
 					currentOutputMarkdown: '## No Files Found\n\nNo relevant source files were found.',
@@ -362,16 +504,16 @@ const App: React.FC = () => {
 			}
 
 			// Update worktree info with file count (only if we created a worktree)
-			if (worktree) {
+			if (worktree && scannedFiles) {
 				worktree.fileCount = scannedFiles.length;
 				worktree.totalSize = calculateTotalSize(scannedFiles);
 				setActiveWorktree(worktree);
 			}
 
-			// Build the prompt with full file contents
-			const fullPrompt = buildWorktreePrompt(scannedFiles, basePrompt, userPrompt);
+			// Build the prompt with full file contents; the chunked review builds one prompt per chunk
+			const fullPrompt = scannedFiles ? buildWorktreePrompt(scannedFiles, basePrompt, userPrompt) : '';
 
-			if (debugMode) {
+			if (debugMode && scannedFiles) {
 				console.log('Worktree Scan Metadata:', {
 					fileCount: scannedFiles.length,
 					totalSize: calculateTotalSize(scannedFiles),
@@ -399,11 +541,21 @@ const App: React.FC = () => {
 					});
 				}
 
-				if (aiConfig.provider === 'ollama') {
+				if (aiConfig.provider === 'ollama' && chunkedDiff !== null) {
+					const response = await window.electronAPI.callOllamaAPIChunked({
+						url: aiConfig.ollama.url,
+						model: aiConfig.ollama.model,
+						diff: chunkedDiff,
+						basePrompt,
+						userPrompt,
+					});
+					result = { success: true, content: response };
+				} else if (aiConfig.provider === 'ollama') {
 					const response = await window.electronAPI.callOllamaAPI({
 						url: aiConfig.ollama.url,
 						model: aiConfig.ollama.model,
 						prompt: fullPrompt,
+						skipCache,
 					});
 					result = { success: true, content: response };
 				} else {
@@ -413,6 +565,7 @@ const App: React.FC = () => {
 						apiKey: aiConfig.azure.apiKey,
 						deploymentName: aiConfig.azure.deployment,
 						prompt: fullPrompt,
+						skipCache,
 					});
 					result = { success: true, content: response };
 				}
@@ -439,6 +592,7 @@ const App: React.FC = () => {
 			}
 
 			if (result.success && result.content) {
+				discardStreamingText();
 				setAppState((prev) => ({
 					...prev,
 					currentOutputMarkdown: result.content || '',
@@ -447,10 +601,6 @@ const App: React.FC = () => {
 
 				// Update total tokens when review completes successfully
 				const currentStats = reviewStats;
-				console.log('Review completed successfully, updating totals:', {
-					currentStats,
-					storeEstimatedTokens,
-				});
 
 				if (debugMode && currentStats) {
 					const totalDuration = Date.now() - appState.reviewStartTime!;
@@ -472,32 +622,58 @@ const App: React.FC = () => {
 					});
 				}
 
-				if (currentStats) {
+				if (reviewCachedRef.current) {
+					if (debugMode) {
+						console.log('Review loaded from cache, no tokens added');
+					}
+				} else if (currentStats) {
 					const inputTokensToAdd = currentStats.inputTokens || storeEstimatedTokens;
 					const outputTokensToAdd = currentStats.outputTokens || currentStats.tokens;
 
-					console.log('Adding tokens:', {
-						inputTokensToAdd,
-						outputTokensToAdd,
-					});
+					if (debugMode) {
+						console.log('Adding tokens:', {
+							inputTokensToAdd,
+							outputTokensToAdd,
+						});
+					}
 
 					if (inputTokensToAdd > 0) {
 						addToTotalInputTokens(inputTokensToAdd);
-						console.log('Updated total input tokens (from completion):', inputTokensToAdd);
 					}
 
 					if (outputTokensToAdd > 0) {
 						addToTotalOutputTokens(outputTokensToAdd);
-						console.log('Updated total output tokens (from completion):', outputTokensToAdd);
 					}
 				} else {
 					// Fallback: use estimated input tokens at minimum
-					console.log('No current stats, using estimated input tokens:', storeEstimatedTokens);
+					if (debugMode) {
+						console.log('No current stats, using estimated input tokens:', storeEstimatedTokens);
+					}
 					if (storeEstimatedTokens > 0) {
 						addToTotalInputTokens(storeEstimatedTokens);
-						console.log('Updated total input tokens (fallback):', storeEstimatedTokens);
 					}
 				}
+			} else if (stopRequestedRef.current) {
+				// Keep whatever was streamed before the user stopped the review, including text still waiting for the next flush
+				const pendingText = pendingStreamTextRef.current;
+				discardStreamingText();
+				setAppState((prev) => {
+					const streamedText = prev.currentOutputMarkdown + pendingText;
+					return {
+						...prev,
+						currentOutputMarkdown: streamedText ? `${streamedText}\n\n> Review stopped before completion.` : '',
+						reviewInProgress: false,
+					};
+				});
+			} else if (result.error?.includes(INCOMPLETE_REVIEW_MESSAGE)) {
+				// Keep the partial review, including text still waiting for the next flush, but mark it as cut off
+				const pendingText = pendingStreamTextRef.current;
+				discardStreamingText();
+				setAppState((prev) => ({
+					...prev,
+					currentOutputMarkdown: `${prev.currentOutputMarkdown}${pendingText}\n\n> **Incomplete review:** the connection closed before the model finished. Run the review again for the full result.`,
+					reviewInProgress: false,
+				}));
 			} else {
 				setAppState((prev) => ({
 					...prev,
@@ -525,31 +701,48 @@ const App: React.FC = () => {
 		}
 	};
 
-	const handleStopReview = () => {
+	const handleRegenerateReview = () => {
+		handleStartReview(lastReviewUncommittedRef.current, true);
+	};
+
+	const handleStopReview = useCallback(() => {
+		stopRequestedRef.current = true;
 		setAppState((prev) => ({
 			...prev,
 			reviewInProgress: false,
 		}));
-	};
 
-	const handleClearOutput = () => {
+		// Abort the in-flight AI request instead of letting it run to completion in the background
+		window.electronAPI.cancelAIRequest().catch((error) => {
+			console.error('Failed to cancel AI request:', error);
+		});
+	}, []);
+
+	// Output actions read the latest text through a ref so their identity stays stable
+	// and the memoized action buttons skip re-rendering while a review streams in
+	const outputMarkdownRef = useRef(appState.currentOutputMarkdown);
+	useEffect(() => {
+		outputMarkdownRef.current = appState.currentOutputMarkdown;
+	}, [appState.currentOutputMarkdown]);
+
+	const handleClearOutput = useCallback(() => {
 		setAppState((prev) => ({
 			...prev,
 			currentOutputMarkdown: '',
 		}));
-	};
+	}, []);
 
-	const handleCopyOutput = async () => {
+	const handleCopyOutput = useCallback(async () => {
 		try {
-			await navigator.clipboard.writeText(appState.currentOutputMarkdown);
+			await navigator.clipboard.writeText(outputMarkdownRef.current);
 			// Could add a toast notification here
 		} catch (error) {
 			console.error('Failed to copy to clipboard:', error);
 		}
-	};
+	}, []);
 
-	const handleExportOutput = () => {
-		const blob = new Blob([appState.currentOutputMarkdown], {
+	const handleExportOutput = useCallback(() => {
+		const blob = new Blob([outputMarkdownRef.current], {
 			type: 'text/markdown',
 		});
 		const url = URL.createObjectURL(blob);
@@ -560,7 +753,7 @@ const App: React.FC = () => {
 		a.click();
 		document.body.removeChild(a);
 		URL.revokeObjectURL(url);
-	};
+	}, []);
 
 	const handleDeleteWorktree = async (worktreePath?: string) => {
 		// If no path provided, use active worktree
@@ -583,10 +776,27 @@ const App: React.FC = () => {
 		}
 	};
 
-	const handleOpenConfig = () => {
+	const handleOpenConfig = useCallback(() => {
 		setShowConfigModal(true);
 		setConnectionTestResult(null); // Clear previous test results
-	};
+	}, []);
+
+	const handleCloseConfig = useCallback(() => {
+		setShowConfigModal(false);
+	}, []);
+
+	// Stable identities: RepositorySection re-runs its branch-change effect whenever onBranchChange changes
+	const handleRepoPathChange = useCallback((path: string | null) => {
+		setAppState((prev) => ({
+			...prev,
+			currentRepoPath: path,
+		}));
+	}, []);
+
+	const handleBranchChange = useCallback((fromBranch: string, toBranch: string) => {
+		setFromBranch(fromBranch);
+		setToBranch(toBranch);
+	}, []);
 
 	const handleTestConnection = async (configToTest: AIProviderConfig) => {
 		setTestingConnection(true);
@@ -644,16 +854,8 @@ const App: React.FC = () => {
 
 			<main className="container mx-auto px-4 py-6 max-w-7xl" role="main">
 				<RepositorySection
-					onRepoPathChange={(path) =>
-						setAppState((prev) => ({
-							...prev,
-							currentRepoPath: path,
-						}))
-					}
-					onBranchChange={(fromBranch, toBranch) => {
-						setFromBranch(fromBranch);
-						setToBranch(toBranch);
-					}}
+					onRepoPathChange={handleRepoPathChange}
+					onBranchChange={handleBranchChange}
 					onStartReview={handleStartReview}
 					onStopReview={handleStopReview}
 					reviewInProgress={appState.reviewInProgress}
@@ -671,19 +873,25 @@ const App: React.FC = () => {
 
 				<OutputSection
 					outputContent={appState.currentOutputMarkdown}
+					isStreaming={appState.reviewInProgress}
 					onClearOutput={handleClearOutput}
 					onCopyOutput={handleCopyOutput}
 					onExportOutput={handleExportOutput}
+					onRegenerate={handleRegenerateReview}
 				/>
 			</main>
 
-			<ConfigModal
-				isOpen={showConfigModal}
-				onClose={() => setShowConfigModal(false)}
-				onTestConnection={handleTestConnection}
-				testingConnection={testingConnection}
-				connectionTestResult={connectionTestResult}
-			/>
+			{showConfigModal && (
+				<Suspense fallback={null}>
+					<ConfigModal
+						isOpen={showConfigModal}
+						onClose={handleCloseConfig}
+						onTestConnection={handleTestConnection}
+						testingConnection={testingConnection}
+						connectionTestResult={connectionTestResult}
+					/>
+				</Suspense>
+			)}
 		</div>
 	);
 };
@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useEffect, useState } from 'react';
 import { AIProviderConfig } from '../../types';
 
 interface OllamaSettingsProps {
@@ -9,6 +9,24 @@ interface OllamaSettingsProps {
 }
 
 const OllamaSettings: React.FC<OllamaSettingsProps> = ({ aiConfig, setAiConfig, onTestConnection, testingConnection }) => {
+	const [installedModels, setInstalledModels] = useState<string[]>([]);
+
+	// Offer the server's installed models so switching models is a pick, not a retype
+	useEffect(() => {
+		let cancelled = false;
+		const timer = setTimeout(async () => {
+			const models = await window.electronAPI.listOllamaModels(aiConfig.ollama.url);
+			if (!cancelled) {
+				setInstalledModels(models);
+			}
+		}, 400);
+
+		return () => {
+			cancelled = true;
+			clearTimeout(timer);
+		};
+	}, [aiConfig.ollama.url]);
+
 	return (
 		<div>
 			<h4 className="text-md font-semibold mb-3">Ollama Settings</h4>
@@ -39,6 +57,7 @@ const OllamaSettings: React.FC<OllamaSettingsProps> = ({ aiConfig, setAiConfig,
 					<input
 						type="text"
 						className="input input-bordered w-full"
+						list="ollama-installed-models"
 						value={aiConfig.ollama.model}
 						onChange={(e) =>
 							setAiConfig({
@@ -50,6 +69,11 @@ const OllamaSettings: React.FC<OllamaSettingsProps> = ({ aiConfig, setAiConfig,
 							})
 						}
 					/>
+					<datalist id="ollama-installed-models">
+						{installedModels.map((name) => (
+							<option key={name} value={name} />
+						))}
+					</datalist>
 				</div>
 			</div>
 
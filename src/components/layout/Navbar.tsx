@@ -1,12 +1,21 @@
 import React from 'react';
+import { useShallow } from 'zustand/react/shallow';
 import { useTokenStore } from '../../store/tokenStore';
 import { TokenUsageDisplay } from '../stats/TokenUsageDisplay';
 
 const Navbar: React.FC = () => {
-	const { getLiveInputTokens, getLiveOutputTokens } = useTokenStore();
+	// Subscribe to the counters themselves; destructuring the whole store re-rendered on any unrelated change
+	const { totalInputTokens, currentSessionInputTokens, totalOutputTokens, currentSessionOutputTokens } = useTokenStore(
+		useShallow((state) => ({
+			totalInputTokens: state.totalInputTokens,
+			currentSessionInputTokens: state.currentSessionInputTokens,
+			totalOutputTokens: state.totalOutputTokens,
+			currentSessionOutputTokens: state.currentSessionOutputTokens,
+		}))
+	);
 
-	const liveInputTokens = getLiveInputTokens();
-	const liveOutputTokens = getLiveOutputTokens();
+	const liveInputTokens = totalInputTokens + currentSessionInputTokens;
+	const liveOutputTokens = totalOutputTokens + currentSessionOutputTokens;
 	return (
 		<nav className="navbar bg-primary text-primary-content shadow-lg" role="banner" aria-label="Main navigation">
 			<div className="flex-1">
@@ -1,6 +1,9 @@
-import React, { useState, useRef, useEffect } from 'react';
+import React, { useState, useRef, useEffect, useMemo } from 'react';
 import { BranchInfo } from '../../types';
 
+// Rendering thousands of rows makes opening and typing sluggish; the search box narrows the rest
+const MAX_VISIBLE_BRANCHES = 200;
+
 interface BranchSelectorProps {
 	id: string;
 	label: string;
@@ -30,8 +33,18 @@ const BranchSelector: React.FC<BranchSelectorProps> = ({
 	const [isOpen, setIsOpen] = useState<boolean>(false);
 	const detailsRef = useRef<HTMLDetailsElement>(null);
 
+	// Lowercase each name once per branch list rather than on every keystroke and render
+	const searchableBranches = useMemo(() => branches.map((branch) => ({ branch, searchName: branch.name.toLowerCase() })), [branches]);
+
 	// Filter branches based on internal filter state
-	const filteredBranches = branches.filter((branch) => branch.name.toLowerCase().includes(filter.toLowerCase()));
+	const filteredBranches = useMemo(() => {
+		if (!filter) return branches;
+		const query = filter.toLowerCase();
+		return searchableBranches.filter((entry) => entry.searchName.includes(query)).map((entry) => entry.branch);
+	}, [branches, searchableBranches, filter]);
+
+	const visibleBranches = filteredBranches.length > MAX_VISIBLE_BRANCHES ? filteredBranches.slice(0, MAX_VISIBLE_BRANCHES) : filteredBranches;
+	const hiddenBranchCount = filteredBranches.length - visibleBranches.length;
 
 	const handleBranchSelect = (branchName: string) => {
 		onBranchSelect(branchName);
@@ -39,6 +52,22 @@ const BranchSelector: React.FC<BranchSelectorProps> = ({
 		setIsOpen(false);
 	};
 
+	// One delegated handler for the whole list instead of a closure per branch row
+	const handleListClick = (event: React.MouseEvent<HTMLUListElement>) => {
+		const item = (event.target as HTMLElement).closest<HTMLElement>('[data-branch]');
+		if (item?.dataset.branch) {
+			handleBranchSelect(item.dataset.branch);
+		}
+	};
+
+	// Toggle through state rather than the native <details> behavior, so the list is mounted only while open
+	const handleSummaryClick = (event: React.MouseEvent<HTMLElement>) => {
+		event.preventDefault();
+		if (!disabled) {
+			setIsOpen((open) => !open);
+		}
+	};
+
 	// Close dropdown when clicking outside
 	useEffect(() => {
 		const handleClickOutside = (event: MouseEvent) => {
@@ -62,11 +91,11 @@ const BranchSelector: React.FC<BranchSelectorProps> = ({
 				<span className="label-text font-medium">{label}</span>
 			</label>
 			<details ref={detailsRef} className="dropdown dropdown-bottom w-full" open={isOpen} onToggle={(e) => setIsOpen((e.target as HTMLDetailsElement).open)}>
-				<summary id={id} className={`btn btn-outline w-full justify-start ${disabled ? 'btn-disabled' : ''}`}>
+				<summary id={id} className={`btn btn-outline w-full justify-start ${disabled ? 'btn-disabled' : ''}`} onClick={handleSummaryClick}>
 					<span>{disabled ? disabledText : selectedBranch || placeholder}</span>
 					<i className="fas fa-chevron-down ml-auto"></i>
 				</summary>
-				{!disabled && (
+				{isOpen && !disabled && (
 					<div className="dropdown-content z-[1] menu p-0 shadow bg-base-100 rounded-box w-full">
 						<div className="p-2">
 							<input
@@ -77,16 +106,16 @@ const BranchSelector: React.FC<BranchSelectorProps> = ({
 								onChange={(e) => setFilter(e.target.value)}
 							/>
 						</div>
-						<ul className="menu max-h-60 overflow-y-auto flex-nowrap">
+						<ul className="menu max-h-60 overflow-y-auto flex-nowrap" onClick={handleListClick}>
 							{isLoading ? (
 								<li>
 									<span className="loading loading-spinner loading-sm"></span> Loading...
 								</li>
-							) : filteredBranches.length > 0 ? (
-								filteredBranches.map((branch) => (
+							) : visibleBranches.length > 0 ? (
+								visibleBranches.map((branch) => (
 									<li key={branch.name}>
 										<a
-											onClick={() => handleBranchSelect(branch.name)}
+											data-branch={branch.name}
 											className={`flex items-center justify-between hover:bg-base-300 ${selectedBranch === branch.name ? 'bg-primary text-primary-content' : ''}`}
 										>
 											<span className="flex items-center gap-2">
@@ -102,6 +131,11 @@ const BranchSelector: React.FC<BranchSelectorProps> = ({
 									<span className="text-gray-500 italic">No branches found</span>
 								</li>
 							)}
+							{!isLoading && hiddenBranchCount > 0 && (
+								<li>
+									<span className="text-gray-500 italic text-xs">{`${hiddenBranchCount} more branches - type to narrow the list`}</span>
+								</li>
+							)}
 						</ul>
 					</div>
 				)}
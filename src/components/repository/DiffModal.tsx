@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useState } from 'react';
 
 interface DiffModalProps {
 	isOpen: boolean;
@@ -9,9 +9,19 @@ interface DiffModalProps {
 	isLoading: boolean;
 }
 
+// Laying out a multi-MB wrapped <pre> freezes the window; show this much until the user asks for the rest
+const PREVIEW_CHARS = 200000;
+
 const DiffModal: React.FC<DiffModalProps> = ({ isOpen, onClose, diffContent, fromBranch, toBranch, isLoading }) => {
+	const [expandedDiff, setExpandedDiff] = useState<string | null>(null);
+
 	if (!isOpen) return null;
 
+	// Expanding applies only to the diff it was requested for
+	const showFullDiff = expandedDiff === diffContent;
+	const isTruncated = !showFullDiff && diffContent.length > PREVIEW_CHARS;
+	const visibleDiff = isTruncated ? diffContent.slice(0, diffContent.lastIndexOf('\n', PREVIEW_CHARS) + 1 || PREVIEW_CHARS) : diffContent;
+
 	const handleCopyDiff = async () => {
 		try {
 			await navigator.clipboard.writeText(diffContent);
@@ -40,7 +50,12 @@ const DiffModal: React.FC<DiffModalProps> = ({ isOpen, onClose, diffContent, fro
 					</div>
 				) : diffContent ? (
 					<div className="bg-base-300 p-4 rounded-lg max-h-96 overflow-auto">
-						<pre className="text-xs whitespace-pre-wrap break-words">{diffContent}</pre>
+						<pre className="text-xs whitespace-pre-wrap break-words">{visibleDiff}</pre>
+						{isTruncated && (
+							<button className="btn btn-sm btn-outline mt-2" onClick={() => setExpandedDiff(diffContent)}>
+								Show full diff ({Math.round(diffContent.length / 1024)} KB)
+							</button>
+						)}
 					</div>
 				) : (
 					<div className="alert alert-info">
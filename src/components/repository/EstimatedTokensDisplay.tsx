@@ -1,4 +1,5 @@
 import React from 'react';
+import { WARNING_ICON, READY_ICON } from './icons';
 
 interface EstimatedTokensDisplayProps {
 	estimatedInputTokens: number;
@@ -23,18 +24,7 @@ const EstimatedTokensDisplay: React.FC<EstimatedTokensDisplayProps> = ({
 
 	return (
 		<div className={`alert ${willChunk ? 'alert-warning' : 'alert-success'} mt-4`}>
-			<svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" className="stroke-current shrink-0 w-6 h-6">
-				{willChunk ? (
-					<path
-						strokeLinecap="round"
-						strokeLinejoin="round"
-						strokeWidth="2"
-						d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"
-					/>
-				) : (
-					<path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-				)}
-			</svg>
+			{willChunk ? WARNING_ICON : READY_ICON}
 			<div className="flex-1">
 				<h3 className={`font-bold text-lg ${willChunk ? 'text-warning-content' : 'text-success-content'}`}>
 					{willChunk ? 'Large Diff - Will Use Chunking' : 'Ready for Review'}
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 
 interface GitRefreshButtonProps {
 	repoPath: string | null;
@@ -11,6 +11,16 @@ const GitRefreshButton: React.FC<GitRefreshButtonProps> = ({ repoPath, onRefresh
 		success: boolean;
 		message: string;
 	} | null>(null);
+	// Single pending auto-hide timer, replaced on every refresh so results never hide each other early
+	const hideTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+	useEffect(() => {
+		return () => {
+			if (hideTimerRef.current) {
+				clearTimeout(hideTimerRef.current);
+			}
+		};
+	}, []);
 
 	const handleRefresh = async () => {
 		if (!repoPath) return;
@@ -54,7 +64,11 @@ const GitRefreshButton: React.FC<GitRefreshButtonProps> = ({ repoPath, onRefresh
 			setIsRefreshing(false);
 
 			// Auto-hide message after 3 seconds
-			setTimeout(() => {
+			if (hideTimerRef.current) {
+				clearTimeout(hideTimerRef.current);
+			}
+			hideTimerRef.current = setTimeout(() => {
+				hideTimerRef.current = null;
 				setLastResult(null);
 			}, 3000);
 		}
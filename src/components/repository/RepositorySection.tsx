@@ -1,12 +1,34 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, lazy, Suspense } from 'react';
 import { BranchInfo, WorktreeInfo } from '../../types';
 import { formatTokenCount } from '../../utils/tokenEstimation';
 import BranchSelector from './BranchSelector';
 import GitRefreshButton from './GitRefreshButton';
 import EstimatedTokensDisplay from './EstimatedTokensDisplay';
-import DiffModal from './DiffModal';
 import WorktreeControls from './WorktreeControls';
-import WorktreeListModal from './WorktreeListModal';
+import { REPOSITORY_ICON, WARNING_ICON } from './icons';
+
+// Modals load and mount on first open rather than with the main window
+const DiffModal = lazy(() => import('./DiffModal'));
+const WorktreeListModal = lazy(() => import('./WorktreeListModal'));
+
+// Auto-selected as the comparison target, in order of preference
+const PREFERRED_TARGET_BRANCHES = ['main', 'master'];
+
+// Convert git branch names to BranchInfo entries
+function toBranchInfoList(branchNames: string[]): BranchInfo[] {
+	return branchNames.map((branchName) => ({
+		name: branchName,
+		type: branchName.startsWith('remotes/') ? 'remote' : 'local',
+	}));
+}
+
+// Keep the previous list when nothing changed so the branch selectors don't rebuild their menus
+function mergeBranchList(previous: BranchInfo[], branchNames: string[]): BranchInfo[] {
+	if (previous.length === branchNames.length && previous.every((branch, index) => branch.name === branchNames[index])) {
+		return previous;
+	}
+	return toBranchInfoList(branchNames);
+}
 
 interface RepositorySectionProps {
 	onRepoPathChange: (path: string | null) => void;
@@ -70,17 +92,15 @@ const RepositorySection: React.FC<RepositorySectionProps> = ({
 				]);
 
 				// Convert string array to BranchInfo array
-				const branchInfoList: BranchInfo[] = branchList.map((branchName) => ({
-					name: branchName,
-					type: branchName.startsWith('remotes/') ? 'remote' : 'local',
-				}));
+				const branchInfoList = toBranchInfoList(branchList);
 				setBranches(branchInfoList);
 				setCurrentBranch(current);
 
 				// Auto-select target branch (main/master if available)
 				if (branchInfoList.length > 0 && !toBranch) {
-					const preferredTargets = ['main', 'master'];
-					const targetBranch = preferredTargets.find((target) => branchInfoList.some((branch) => branch.name === target)) || branchInfoList[0].name;
+					// Hash the names once instead of rescanning the whole list for each candidate
+					const branchNames = new Set(branchList);
+					const targetBranch = PREFERRED_TARGET_BRANCHES.find((target) => branchNames.has(target)) || branchInfoList[0].name;
 					setToBranch(targetBranch);
 				}
 
@@ -134,11 +154,7 @@ const RepositorySection: React.FC<RepositorySectionProps> = ({
 		try {
 			// Reload branches after git fetch/pull
 			const branchList = await window.electronAPI.getGitBranches(repoPath);
-			const branchInfoList: BranchInfo[] = branchList.map((branchName) => ({
-				name: branchName,
-				type: branchName.startsWith('remotes/') ? 'remote' : 'local',
-			}));
-			setBranches(branchInfoList);
+			setBranches((prev) => mergeBranchList(prev, branchList));
 		} catch (error) {
 			console.error('Failed to reload branches:', error);
 		}
@@ -175,10 +191,7 @@ const RepositorySection: React.FC<RepositorySectionProps> = ({
 				<div className="card-body">
 					<div className="flex justify-between items-center mb-4">
 						<h2 className="card-title text-2xl">
-							<svg xmlns="http://www.w3.org/2000/svg" className="h-6 w-6" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-								<path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M3 7v10a2 2 0 002 2h14a2 2 0 002-2V9a2 2 0 00-2-2H5a2 2 0 00-2-2z" />
-								<path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="m8 1 4 4 4-4" />
-							</svg>
+							{REPOSITORY_ICON}
 							Repository & Branches
 						</h2>
 						<div className="flex gap-2">
@@ -292,14 +305,7 @@ const RepositorySection: React.FC<RepositorySectionProps> = ({
 						</div>
 					) : repoPath && fromBranch && toBranch && fromBranch !== toBranch && estimatedInputTokens === 0 && !reviewInProgress ? (
 						<div className="alert alert-warning mt-4">
-							<svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" className="stroke-current shrink-0 w-6 h-6">
-								<path
-									strokeLinecap="round"
-									strokeLinejoin="round"
-									strokeWidth="2"
-									d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"
-								/>
-							</svg>
+							{WARNING_ICON}
 							<div>
 								<h3 className="font-bold text-lg">No Differences Found</h3>
 								<div className="text-sm">The selected branches have no differences, or the diff could not be calculated.</div>
@@ -346,16 +352,24 @@ const RepositorySection: React.FC<RepositorySectionProps> = ({
 					</div>
 				</div>
 
-				<DiffModal
-					isOpen={showDiffModal}
-					onClose={() => setShowDiffModal(false)}
-					diffContent={diffContent}
-					fromBranch={fromBranch}
-					toBranch={toBranch}
-					isLoading={isLoadingDiff}
-				/>
+				{showDiffModal && (
+					<Suspense fallback={null}>
+						<DiffModal
+							isOpen={showDiffModal}
+							onClose={() => setShowDiffModal(false)}
+							diffContent={diffContent}
+							fromBranch={fromBranch}
+							toBranch={toBranch}
+							isLoading={isLoadingDiff}
+						/>
+					</Suspense>
+				)}
 
-				<WorktreeListModal isOpen={showWorktreeModal} onClose={() => setShowWorktreeModal(false)} repoPath={repoPath} onDeleteWorktree={onDeleteWorktree} />
+				{showWorktreeModal && (
+					<Suspense fallback={null}>
+						<WorktreeListModal isOpen={showWorktreeModal} onClose={() => setShowWorktreeModal(false)} repoPath={repoPath} onDeleteWorktree={onDeleteWorktree} />
+					</Suspense>
+				)}
 			</div>
 		</>
 	);
@@ -22,4 +22,4 @@ const ActionButtons: React.FC<ActionButtonsProps> = ({ onClearOutput, onCopyOutp
 	);
 };
 
-export default ActionButtons;
+export default React.memo(ActionButtons);
@@ -1,28 +1,90 @@
-import React, { useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import { marked } from 'marked';
 import WelcomeMessage from '../layout/WelcomeMessage';
 import ActionButtons from './ActionButtons';
 
+// How close (in px) to the bottom the view must be to keep following new output
+const STICK_TO_BOTTOM_THRESHOLD = 40;
+
+// Plain text is rendered as fixed-size blocks so an append only touches the last text node;
+// one ever-growing text node would be replaced, and re-laid out, on every streamed flush
+const PLAIN_TEXT_BLOCK_CHARS = 4096;
+
+function splitIntoBlocks(text: string): string[] {
+	const blocks: string[] = [];
+	let start = 0;
+	while (start < text.length) {
+		let end = Math.min(start + PLAIN_TEXT_BLOCK_CHARS, text.length);
+		// Never split a surrogate pair across two text nodes
+		const lastCode = text.charCodeAt(end - 1);
+		if (end < text.length && lastCode >= 0xd800 && lastCode <= 0xdbff) {
+			end++;
+		}
+		blocks.push(text.slice(start, end));
+		start = end;
+	}
+	return blocks;
+}
+
+// Block boundaries only depend on the text before them, so earlier blocks keep equal strings and skip re-rendering
+const PlainTextBlockView: React.FC<{ text: string }> = ({ text }) => <>{text}</>;
+
+const PlainTextBlock = React.memo(PlainTextBlockView);
+
 interface OutputSectionProps {
 	outputContent: string;
+	/** Text is still arriving; render it as plain text until the review completes */
+	isStreaming?: boolean;
 	onClearOutput: () => void;
 	onCopyOutput: () => void;
 	onExportOutput: () => void;
+	/** Run the last review again, bypassing the cached result */
+	onRegenerate?: () => void;
 }
 
-const OutputSection: React.FC<OutputSectionProps> = ({ outputContent, onClearOutput, onCopyOutput, onExportOutput }) => {
+const OutputSection: React.FC<OutputSectionProps> = ({ outputContent, isStreaming = false, onClearOutput, onCopyOutput, onExportOutput, onRegenerate }) => {
 	const [showRaw, setShowRaw] = useState(false);
+	const outputRef = useRef<HTMLDivElement>(null);
+	const stickToBottomRef = useRef(true);
+
+	// Re-parsing the whole document on every streamed batch is quadratic, so stream into a <pre>
+	// and parse markdown once when the review completes
+	const showPlainText = showRaw || isStreaming;
+
+	// Follow streamed text like a terminal, unless the user scrolled up to read earlier output
+	useEffect(() => {
+		const element = outputRef.current;
+		if (element && stickToBottomRef.current) {
+			element.scrollTop = element.scrollHeight;
+		}
+	}, [outputContent, showPlainText]);
+
+	const handleScroll = () => {
+		const element = outputRef.current;
+		if (!element) return;
+		stickToBottomRef.current = element.scrollHeight - element.scrollTop - element.clientHeight <= STICK_TO_BOTTOM_THRESHOLD;
+	};
+
+	// Parse markdown only when the text changes, not when unrelated state (e.g. scrolling) re-renders the section
+	const renderedHtml = useMemo(() => (showPlainText || !outputContent.trim() ? '' : (marked.parse(outputContent) as string)), [outputContent, showPlainText]);
+	const plainTextBlocks = useMemo(() => (showPlainText ? splitIntoBlocks(outputContent) : []), [outputContent, showPlainText]);
 
 	const renderContent = (markdown: string) => {
 		if (!markdown.trim()) {
 			return <WelcomeMessage />;
 		}
 
-		if (showRaw) {
-			return <pre className="whitespace-pre-wrap font-mono text-sm bg-transparent text-base-content">{markdown}</pre>;
+		if (showPlainText) {
+			return (
+				<pre className="whitespace-pre-wrap font-mono text-sm bg-transparent text-base-content">
+					{plainTextBlocks.map((block, index) => (
+						<PlainTextBlock key={index} text={block} />
+					))}
+				</pre>
+			);
 		}
 
-		return <div className="prose prose-sm max-w-none dark:prose-invert" dangerouslySetInnerHTML={{ __html: marked.parse(markdown) }} />;
+		return <div className="prose prose-sm max-w-none dark:prose-invert" dangerouslySetInnerHTML={{ __html: renderedHtml }} />;
 	};
 
 	return (
@@ -42,11 +104,24 @@ const OutputSection: React.FC<OutputSectionProps> = ({ outputContent, onClearOut
 							<i className={`fas ${showRaw ? 'fa-eye' : 'fa-code'}`}></i>
 							{showRaw ? 'Show Rendered' : 'Show Raw'}
 						</button>
+						{onRegenerate && (
+							<button
+								className="btn btn-sm btn-outline"
+								onClick={onRegenerate}
+								disabled={isStreaming || !outputContent.trim()}
+								title="Ask the model again instead of reusing the cached review"
+								aria-label="Regenerate review"
+							>
+								<i className="fas fa-redo"></i> Regenerate
+							</button>
+						)}
 						<ActionButtons onClearOutput={onClearOutput} onCopyOutput={onCopyOutput} onExportOutput={onExportOutput} />
 					</div>
 				</div>
 
 				<div
+					ref={outputRef}
+					onScroll={handleScroll}
 					className="bg-base-200 border border-base-300 rounded-lg output-text overflow-auto"
 					role="log"
 					aria-live="polite"
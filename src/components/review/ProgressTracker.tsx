@@ -1,4 +1,5 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect } from 'react';
+import { formatInteger } from '../../utils/tokenEstimation';
 
 interface ProgressTrackerProps {
 	reviewStats: {
@@ -19,45 +20,54 @@ interface ProgressTrackerProps {
 	};
 }
 
+interface Stat {
+	label: string;
+	value: string;
+}
+
+// Stats are compared by their formatted text, so ticks that change no displayed value skip the grid entirely
+const areStatsEqual = (prev: { stats: Stat[] }, next: { stats: Stat[] }): boolean =>
+	prev.stats.length === next.stats.length && prev.stats.every((stat, i) => stat.label === next.stats[i].label && stat.value === next.stats[i].value);
+
+const StatGridView: React.FC<{ stats: Stat[] }> = ({ stats }) => (
+	<div className="grid grid-cols-2 gap-4 text-xs">
+		{stats.map((stat) => (
+			<div key={stat.label}>
+				<span className="text-base-content/70">{stat.label}:</span>
+				<div className="font-mono">{stat.value}</div>
+			</div>
+		))}
+	</div>
+);
+
+const StatGrid = React.memo(StatGridView, areStatsEqual);
+
 const ProgressTracker: React.FC<ProgressTrackerProps> = ({ reviewStats, reviewInProgress, chunkingInfo }) => {
-	const [smoothTime, setSmoothTime] = useState(0);
-	const [smoothSpeed, setSmoothSpeed] = useState(0);
-	const startTimeRef = useRef<number | null>(null);
+	const [startTime, setStartTime] = useState<number | null>(null);
+	const [, setClockTick] = useState(0);
 
 	// Start timer when review begins
 	useEffect(() => {
-		if (reviewInProgress && !startTimeRef.current) {
-			startTimeRef.current = Date.now();
-		} else if (!reviewInProgress) {
-			startTimeRef.current = null;
-		}
+		setStartTime(reviewInProgress ? Date.now() : null);
 	}, [reviewInProgress]);
 
-	// Smooth update loop for time and speed
+	// Progress events already re-render with fresh numbers while tokens stream in;
+	// this slow tick only keeps the elapsed time moving while the model is silent (e.g. prompt evaluation)
 	useEffect(() => {
 		if (!reviewInProgress) {
 			return;
 		}
 
-		const interval = setInterval(() => {
-			if (startTimeRef.current) {
-				const elapsed = (Date.now() - startTimeRef.current) / 1000;
-				setSmoothTime(elapsed);
-
-				// Calculate smooth speed based on current tokens
-				const currentTokens = reviewStats?.outputTokens || 0;
-				if (elapsed > 0) {
-					const instantSpeed = currentTokens / elapsed;
-					setSmoothSpeed(instantSpeed);
-				}
-			}
-		}, 100); // Update every 100ms for smooth animation
-
+		const interval = setInterval(() => setClockTick((tick) => tick + 1), 1000);
 		return () => clearInterval(interval);
-	}, [reviewInProgress, reviewStats?.outputTokens]);
+	}, [reviewInProgress]);
+
+	// Time and speed are derived at render time from the latest token count
+	const elapsed = startTime ? (Date.now() - startTime) / 1000 : 0;
+	const liveSpeed = elapsed > 0 ? (reviewStats?.outputTokens || 0) / elapsed : 0;
 
 	// Calculate average speed when completed
-	const avgSpeed = reviewStats && !reviewInProgress ? reviewStats.outputTokens / (reviewStats.responseTime / 1000) : smoothSpeed;
+	const avgSpeed = reviewStats && !reviewInProgress ? reviewStats.outputTokens / (reviewStats.responseTime / 1000) : liveSpeed;
 
 	if (!reviewInProgress && !reviewStats) {
 		return null;
@@ -84,7 +94,12 @@ const ProgressTracker: React.FC<ProgressTrackerProps> = ({ reviewStats, reviewIn
 									<span>Progress</span>
 									<span>{Math.round(reviewStats.progress)}%</span>
 								</div>
-								<progress className="progress progress-primary w-full" value={reviewStats.progress} max="100"></progress>
+								{reviewStats.progress > 0 ? (
+									<progress className="progress progress-primary w-full" value={reviewStats.progress} max="100"></progress>
+								) : (
+									// No value yet: let the native indeterminate animation run instead of a frozen empty bar
+									<progress className="progress progress-primary w-full"></progress>
+								)}
 							</div>
 						)}
 
@@ -95,24 +110,14 @@ const ProgressTracker: React.FC<ProgressTrackerProps> = ({ reviewStats, reviewIn
 							</div>
 						)}
 
-						<div className="grid grid-cols-2 gap-4 text-xs">
-							<div>
-								<span className="text-base-content/70">Tokens Sent:</span>
-								<div className="font-mono">{(reviewStats?.inputTokens || 0).toLocaleString()}</div>
-							</div>
-							<div>
-								<span className="text-base-content/70">Output Tokens:</span>
-								<div className="font-mono">{(reviewStats?.outputTokens || 0).toLocaleString()}</div>
-							</div>
-							<div>
-								<span className="text-base-content/70">Speed:</span>
-								<div className="font-mono">{smoothSpeed.toFixed(1)} tok/s</div>
-							</div>
-							<div>
-								<span className="text-base-content/70">Processing:</span>
-								<div className="font-mono">{smoothTime.toFixed(1)}s</div>
-							</div>
-						</div>
+						<StatGrid
+							stats={[
+								{ label: 'Tokens Sent', value: formatInteger(reviewStats?.inputTokens || 0) },
+								{ label: 'Output Tokens', value: formatInteger(reviewStats?.outputTokens || 0) },
+								{ label: 'Speed', value: `${liveSpeed.toFixed(1)} tok/s` },
+								{ label: 'Processing', value: `${elapsed.toFixed(1)}s` },
+							]}
+						/>
 					</div>
 				)}
 
@@ -123,24 +128,14 @@ const ProgressTracker: React.FC<ProgressTrackerProps> = ({ reviewStats, reviewIn
 							<span className="text-sm font-medium">Review Completed</span>
 						</div>
 
-						<div className="grid grid-cols-2 gap-4 text-xs">
-							<div>
-								<span className="text-base-content/70">Input Tokens:</span>
-								<div className="font-mono">{reviewStats.inputTokens}</div>
-							</div>
-							<div>
-								<span className="text-base-content/70">Output Tokens:</span>
-								<div className="font-mono">{reviewStats.outputTokens}</div>
-							</div>
-							<div>
-								<span className="text-base-content/70">Avg Speed:</span>
-								<div className="font-mono">{avgSpeed.toFixed(1)} tok/s</div>
-							</div>
-							<div>
-								<span className="text-base-content/70">Total Time:</span>
-								<div className="font-mono">{(reviewStats.responseTime / 1000).toFixed(1)}s</div>
-							</div>
-						</div>
+						<StatGrid
+							stats={[
+								{ label: 'Input Tokens', value: String(reviewStats.inputTokens) },
+								{ label: 'Output Tokens', value: String(reviewStats.outputTokens) },
+								{ label: 'Avg Speed', value: `${avgSpeed.toFixed(1)} tok/s` },
+								{ label: 'Total Time', value: `${(reviewStats.responseTime / 1000).toFixed(1)}s` },
+							]}
+						/>
 					</div>
 				)}
 			</div>
@@ -3,8 +3,12 @@ import path from 'path';
 import fs from 'fs/promises';
 import { spawn } from 'child_process';
 import simpleGit, { SimpleGit } from 'simple-git';
-import { OllamaProvider, OllamaConfig } from './providers/OllamaProvider';
+import { OllamaProvider, OllamaConfig, OllamaChunkedConfig } from './providers/OllamaProvider';
 import { AzureOpenAIProvider, AzureOpenAIConfig } from './providers/AzureOpenAIProvider';
+import { runGitStreaming, splitOutputLines, DIFF_EXCLUDE_PATHSPECS } from './utils/gitProcess';
+import { GitDirs, getBranchRefsStamp, readLocalBranches, readCurrentBranch } from './utils/gitRefs';
+import { GitObjectResolver } from './utils/gitCatFile';
+import { destroyHttpAgents } from './utils/httpAgents';
 
 // Handle Squirrel events on Windows
 if (process.platform === 'win32') {
@@ -19,6 +23,7 @@ if (process.platform === 'win32') {
 			// Create shortcuts
 			spawn(updateDotExe, ['--createShortcut', exeName], {
 				detached: true,
+				stdio: 'ignore',
 			});
 
 			app.quit();
@@ -32,6 +37,7 @@ if (process.platform === 'win32') {
 
 			spawn(updateDotExe, ['--removeShortcut', exeName], {
 				detached: true,
+				stdio: 'ignore',
 			});
 
 			app.quit();
@@ -53,6 +59,18 @@ if (process.platform === 'win32') {
 
 let mainWindow: BrowserWindow | null = null;
 
+// The environment doesn't change while the app runs, so decide development vs production once
+const isDev = process.env.NODE_ENV === 'development';
+
+const DEV_RELOAD_SHORTCUTS = ['F5', 'CommandOrControl+R'];
+
+// Shared by all reload shortcuts; always targets the current window
+const reloadMainWindow = (): void => {
+	if (mainWindow && !mainWindow.isDestroyed()) {
+		mainWindow.webContents.reloadIgnoringCache();
+	}
+};
+
 const createWindow = (): void => {
 	mainWindow = new BrowserWindow({
 		width: 1200,
@@ -71,8 +89,6 @@ const createWindow = (): void => {
 	});
 
 	// Load the app - Check for development vs production
-	const isDev = process.env.NODE_ENV === 'development';
-
 	if (isDev) {
 		// In development, load from Vite dev server
 		const devServerUrl = 'http://localhost:3002';
@@ -91,17 +107,12 @@ const createWindow = (): void => {
 		mainWindow.webContents.openDevTools();
 
 		try {
-			// Add keyboard shortcuts for development
-			globalShortcut.register('F5', () => {
-				if (mainWindow && !mainWindow.isDestroyed()) {
-					mainWindow.webContents.reloadIgnoringCache();
+			// Add keyboard shortcuts for development; they stay registered when the window is re-created
+			for (const accelerator of DEV_RELOAD_SHORTCUTS) {
+				if (!globalShortcut.isRegistered(accelerator)) {
+					globalShortcut.register(accelerator, reloadMainWindow);
 				}
-			});
-			globalShortcut.register('CommandOrControl+R', () => {
-				if (mainWindow && !mainWindow.isDestroyed()) {
-					mainWindow.webContents.reloadIgnoringCache();
-				}
-			});
+			}
 		} catch (error) {
 			console.log('Dev tools not available:', (error as Error).message);
 		}
@@ -151,11 +162,6 @@ const createWindow = (): void => {
 			console.log('F12 shortcut not available:', (error as Error).message);
 		}
 	});
-
-	// Open DevTools in development
-	if (process.env.NODE_ENV === 'development') {
-		mainWindow.webContents.openDevTools();
-	}
 };
 
 // Config file management
@@ -307,10 +313,25 @@ ipcMain.handle('select-directory', async (): Promise<string | null> => {
 		title: 'Select Git Repository',
 	});
 
-	if (!result.canceled && result.filePaths.length > 0) {
-		return result.filePaths[0];
+	if (result.canceled || result.filePaths.length === 0) {
+		return null;
+	}
+
+	// One rev-parse both validates the selection and resolves the repository root,
+	// so git's repo-relative file paths line up even if a subfolder was picked
+	const selectedPath = result.filePaths[0];
+	try {
+		const topLevel = await simpleGit(selectedPath).revparse(['--show-toplevel']);
+		return path.normalize(topLevel.trim());
+	} catch (error) {
+		await dialog.showMessageBox(mainWindow, {
+			type: 'error',
+			title: 'Not a Git Repository',
+			message: `"${selectedPath}" is not inside a Git repository.`,
+			detail: (error as Error).message,
+		});
+		return null;
 	}
-	return null;
 });
 
 // IPC handlers for Git operations
@@ -321,9 +342,96 @@ interface GitOperationResult {
 	summary?: unknown;
 }
 
+// Reuse one simple-git client per repository instead of building a new one for every IPC call
+const gitClients = new Map<string, SimpleGit>();
+
+function getGit(repoPath: string): SimpleGit {
+	const key = path.resolve(repoPath);
+	let git = gitClients.get(key);
+	if (!git) {
+		git = simpleGit(key);
+		gitClients.set(key, git);
+	}
+	return git;
+}
+
+// One persistent cat-file helper per repository for resolving branch names to commits
+const objectResolvers = new Map<string, GitObjectResolver>();
+
+function getObjectResolver(repoPath: string): GitObjectResolver {
+	const key = path.resolve(repoPath);
+	let resolver = objectResolvers.get(key);
+	if (!resolver) {
+		resolver = new GitObjectResolver(key);
+		objectResolvers.set(key, resolver);
+	}
+	return resolver;
+}
+
+// Git metadata directories never move for a repository, so resolve them once
+const gitDirsCache = new Map<string, GitDirs>();
+
+async function getGitDirs(git: SimpleGit, repoPath: string): Promise<GitDirs> {
+	const key = path.resolve(repoPath);
+	let dirs = gitDirsCache.get(key);
+	if (!dirs) {
+		const [gitDir, commonDir] = (await git.revparse(['--absolute-git-dir', '--git-common-dir'])).split('\n').map((line) => line.trim());
+		dirs = { gitDir, commonDir: path.resolve(key, commonDir) };
+		gitDirsCache.set(key, dirs);
+	}
+	return dirs;
+}
+
+async function getCurrentBranch(git: SimpleGit, repoPath: string): Promise<string> {
+	// HEAD is a one-line file; read it directly instead of spawning git
+	const currentBranch = await readCurrentBranch(await getGitDirs(git, repoPath));
+	if (currentBranch) {
+		return currentBranch;
+	}
+
+	return (await git.revparse(['--abbrev-ref', 'HEAD'])).trim();
+}
+
+// Strip 'remotes/' prefix and get local branch name if remote branch is provided
+function normalizeBranchName(branchName: string): string {
+	if (branchName.startsWith('remotes/origin/')) {
+		return branchName.replace('remotes/origin/', '');
+	}
+	if (branchName.startsWith('remotes/')) {
+		return branchName.replace(/^remotes\/[^/]+\//, '');
+	}
+	return branchName;
+}
+
+// Resolve a branch to its commit SHA, preferring the local branch and falling back to the name
+// as given (e.g. a remote ref). Lookups go through the repository's persistent cat-file helper.
+async function resolveBranchSha(repoPath: string, branchName: string): Promise<string> {
+	const resolver = getObjectResolver(repoPath);
+	const normalized = normalizeBranchName(branchName);
+
+	let sha = await resolver.resolveCommit(normalized);
+	if (!sha && normalized !== branchName) {
+		sha = await resolver.resolveCommit(branchName);
+	}
+	if (!sha) {
+		throw new Error(`unknown revision '${branchName}'`);
+	}
+	return sha;
+}
+
+// Lets the renderer check the base branch up front instead of failing partway into a review
+ipcMain.handle('branch-exists', async (_event: IpcMainInvokeEvent, repoPath: string, branchName: string): Promise<boolean> => {
+	try {
+		await resolveBranchSha(repoPath, branchName);
+		return true;
+	} catch {
+		return false;
+	}
+});
+
 ipcMain.handle('git-fetch', async (_event: IpcMainInvokeEvent, repoPath: string): Promise<GitOperationResult> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
+		const git: SimpleGit = getGit(repoPath);
 		await git.fetch();
 		return { success: true, message: 'Successfully fetched latest changes' };
 	} catch (error) {
@@ -337,7 +445,7 @@ ipcMain.handle('git-fetch', async (_event: IpcMainInvokeEvent, repoPath: string)
 
 ipcMain.handle('git-pull', async (_event: IpcMainInvokeEvent, repoPath: string): Promise<GitOperationResult> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
+		const git: SimpleGit = getGit(repoPath);
 		const result = await git.pull();
 		return {
 			success: true,
@@ -355,20 +463,39 @@ ipcMain.handle('git-pull', async (_event: IpcMainInvokeEvent, repoPath: string):
 
 ipcMain.handle('get-current-branch', async (_event: IpcMainInvokeEvent, repoPath: string): Promise<string> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
-		const currentBranch = await git.revparse(['--abbrev-ref', 'HEAD']);
-		return currentBranch.trim();
+		return await getCurrentBranch(getGit(repoPath), repoPath);
 	} catch (error) {
 		const err = error as Error;
 		throw new Error(`Failed to get current branch: ${err.message}`);
 	}
 });
 
+// Local branch lists keyed by repository, valid while the refs stamp is unchanged
+const branchCache = new Map<string, { stamp: string; branches: string[] }>();
+
 ipcMain.handle('get-git-branches', async (_event: IpcMainInvokeEvent, repoPath: string): Promise<string[]> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
-		const branches = await git.branchLocal();
-		return branches.all;
+		const git: SimpleGit = getGit(repoPath);
+		const key = path.resolve(repoPath);
+		const gitDirs = await getGitDirs(git, repoPath);
+		const stamp = await getBranchRefsStamp(gitDirs);
+
+		const cached = branchCache.get(key);
+		if (cached && cached.stamp === stamp) {
+			return cached.branches;
+		}
+
+		// Read the refs straight from disk; only spawn git when the layout isn't one we understand
+		let branches = await readLocalBranches(gitDirs);
+		if (!branches) {
+			// for-each-ref skips the formatting and upstream tracking work done by `git branch`;
+			// lstrip=2 drops the refs/heads/ prefix in git, so each line is already a branch name
+			const output = await git.raw(['for-each-ref', '--format=%(refname:lstrip=2)', 'refs/heads']);
+			branches = output.split('\n').filter(Boolean);
+		}
+
+		branchCache.set(key, { stamp, branches });
+		return branches;
 	} catch (error) {
 		const err = error as Error & { code?: string };
 		let errorMessage = `Failed to get branches: ${err.message}`;
@@ -404,42 +531,48 @@ ipcMain.handle('get-git-branches', async (_event: IpcMainInvokeEvent, repoPath:
 	}
 });
 
-ipcMain.handle('get-git-diff', async (_event: IpcMainInvokeEvent, repoPath: string, baseBranch: string, targetBranch: string): Promise<string> => {
-	try {
-		const git: SimpleGit = simpleGit(repoPath);
+// Small LRU of recent diffs keyed by repository and commit SHAs
+const MAX_CACHED_DIFFS = 8;
+const diffCache = new Map<string, string>();
 
-		// Check if a branch exists locally
-		const branchExists = async (branchName: string): Promise<boolean> => {
-			try {
-				await git.revparse(['--verify', branchName]);
-				return true;
-			} catch {
-				return false;
-			}
-		};
+// Diffs larger than this are far beyond any model context window, so stop reading git output here
+const MAX_DIFF_BYTES = 10 * 1024 * 1024;
 
-		// Strip 'remotes/' prefix and get local branch name if remote branch is provided
-		const normalizeBranchName = (branchName: string): string => {
-			if (branchName.startsWith('remotes/origin/')) {
-				return branchName.replace('remotes/origin/', '');
-			}
-			if (branchName.startsWith('remotes/')) {
-				return branchName.replace(/^remotes\/[^/]+\//, '');
-			}
-			return branchName;
-		};
-
-		// Prefer local branch, fallback to remote if local doesn't exist
-		const resolvedBaseBranch = (await branchExists(normalizeBranchName(baseBranch))) ? normalizeBranchName(baseBranch) : baseBranch;
+// Build (or reuse) the review diff of baseBranch against its merge base with targetBranch
+async function getReviewDiff(repoPath: string, baseBranch: string, targetBranch: string, signal?: AbortSignal): Promise<string> {
+	try {
+		// Prefer local branch, fallback to remote if local doesn't exist.
+		// Commit SHAs identify the diff exactly, so repeated reviews of unchanged branches hit the cache
+		const [targetSha, baseSha] = await Promise.all([resolveBranchSha(repoPath, targetBranch), resolveBranchSha(repoPath, baseBranch)]);
+		const cacheKey = `${path.resolve(repoPath)}\0${targetSha}\0${baseSha}`;
+		const cachedDiff = diffCache.get(cacheKey);
+		if (cachedDiff !== undefined) {
+			// Refresh recency
+			diffCache.delete(cacheKey);
+			diffCache.set(cacheKey, cachedDiff);
+			return cachedDiff;
+		}
 
-		const resolvedTargetBranch = (await branchExists(normalizeBranchName(targetBranch))) ? normalizeBranchName(targetBranch) : targetBranch;
+		// Diff from the merge base of target (main) to base (feature) - shows what changes are in feature branch.
+		// Three-dot syntax computes the merge base inside the same git process.
+		// Deleted files and lockfiles/minified bundles are skipped: they cost tokens without adding reviewable code.
+		// -M turns renames into a short rename header plus the changed lines instead of a full add
+		const result = await runGitStreaming(repoPath, ['diff', '--no-prefix', '-U3', '-M', '--diff-filter=ACMRT', `${targetSha}...${baseSha}`, '--', ...DIFF_EXCLUDE_PATHSPECS], {
+			maxBytes: MAX_DIFF_BYTES,
+			signal,
+		});
+		let diff = result.output;
+		if (result.truncated) {
+			console.warn(`Diff exceeded ${MAX_DIFF_BYTES} bytes and was truncated`);
+			diff += `\n... diff truncated at ${Math.round(MAX_DIFF_BYTES / (1024 * 1024))} MB ...\n`;
+		}
 
-		// Get merge base between the two branches
-		await git.raw(['merge-base', resolvedTargetBranch, resolvedBaseBranch]);
+		diffCache.set(cacheKey, diff);
+		if (diffCache.size > MAX_CACHED_DIFFS) {
+			// Evict the least recently used entry
+			diffCache.delete(diffCache.keys().next().value as string);
+		}
 
-		// Get diff from target (main) to base (feature) - shows what changes are in feature branch
-		// This is equivalent to: git diff target...base
-		const diff = await git.raw(['diff', '--no-prefix', '-U3', resolvedTargetBranch, resolvedBaseBranch]);
 		return diff;
 	} catch (error) {
 		const err = error as Error & { code?: string };
@@ -452,7 +585,7 @@ ipcMain.handle('get-git-diff', async (_event: IpcMainInvokeEvent, repoPath: stri
 				'2. Run "git branch -a" to see all available branches\n' +
 				'3. Pull latest changes with "git fetch" if branches are remote\n' +
 				'4. Check branch names for typos or special characters';
-		} else if (err.message.includes('merge-base') || err.message.includes('no common commits')) {
+		} else if (err.message.includes('merge base') || err.message.includes('no common commits')) {
 			errorMessage +=
 				'\n\nTroubleshooting steps:\n' +
 				'1. Check if branches share common history\n' +
@@ -468,7 +601,11 @@ ipcMain.handle('get-git-diff', async (_event: IpcMainInvokeEvent, repoPath: stri
 
 		throw new Error(errorMessage);
 	}
-});
+}
+
+ipcMain.handle('get-git-diff', (_event: IpcMainInvokeEvent, repoPath: string, baseBranch: string, targetBranch: string): Promise<string> =>
+	getReviewDiff(repoPath, baseBranch, targetBranch)
+);
 
 // Initialize AI providers
 const ollamaProvider = new OllamaProvider();
@@ -477,99 +614,251 @@ const azureProvider = new AzureOpenAIProvider();
 // Import token utilities
 import { buildPrompt } from './utils/prompts';
 import { countTokens } from './utils/tokenEstimation';
-import { needsChunking, DEFAULT_CHUNK_CONFIG, ChunkConfig } from './utils/diffChunker';
+import { DEFAULT_CHUNK_CONFIG, OLLAMA_CHUNK_CONFIG, ChunkConfig } from './utils/diffChunker';
 import { scanWorktree, scanSpecificFiles } from './utils/fileScanner';
+import { getReviewCacheKey, readCachedReview, writeCachedReview } from './utils/reviewCache';
 import { WorktreeInfo, ScannedFile, ScanOptions } from './types';
 import os from 'os';
 
+interface TokenEstimate {
+	estimatedTokens: number;
+	willChunk: boolean;
+	chunkCount: number;
+}
+
+// Estimate prompt tokens for a diff and whether the request will be split into chunks
+function estimateTokensWithChunking(
+	diff: string,
+	basePrompt: string,
+	userPrompt: string,
+	provider: 'ollama' | 'azure',
+	chunkConfig?: Partial<ChunkConfig>
+): TokenEstimate {
+	// Tokenize the diff exactly once; the prompt wrapper is counted separately and the two are
+	// summed, instead of re-tokenizing the multi-MB diff for the total, the log and the chunk check
+	const diffTokens = countTokens(diff, 'cl100k_base');
+	const basePromptTokens = countTokens(buildPrompt('', basePrompt, userPrompt), 'cl100k_base');
+	const estimatedTokens = diffTokens + basePromptTokens;
+
+	if (provider === 'azure') {
+		// Calculate chunk context overhead
+		const estimatedChunkContextTokens = 100;
+
+		// Configure chunking the same way as the actual generation
+		// Each chunk should be AT the rate limit
+		const rateLimitTokens = chunkConfig?.maxTokensPerChunk || DEFAULT_CHUNK_CONFIG.maxTokensPerChunk;
+		const maxDiffTokensPerChunk = rateLimitTokens - basePromptTokens - estimatedChunkContextTokens;
+
+		if (isDev) {
+			console.log('[Chunking Calculation]', {
+				rateLimitTokens,
+				basePromptTokens,
+				estimatedChunkContextTokens,
+				maxDiffTokensPerChunk,
+				diffTokens,
+			});
+		}
+
+		// Same test as needsChunking() with systemPromptTokens: 0, reusing the count from above
+		const willChunk = diffTokens > maxDiffTokensPerChunk;
+
+		if (willChunk) {
+			// Simple calculation: total tokens / rate limit = number of chunks
+			const chunkCount = Math.ceil(estimatedTokens / rateLimitTokens);
+
+			if (isDev) {
+				console.log('[Chunking Result]', {
+					estimatedTokens,
+					rateLimitTokens,
+					chunkCount,
+				});
+			}
+
+			return {
+				estimatedTokens,
+				willChunk: true,
+				chunkCount,
+			};
+		}
+	} else {
+		// Same limit as OllamaProvider.generateWithChunking, which splits the diff once it exceeds one request
+		const maxTokensPerChunk = chunkConfig?.maxTokensPerChunk || OLLAMA_CHUNK_CONFIG.maxTokensPerChunk;
+		const maxDiffTokensPerChunk = maxTokensPerChunk - (OLLAMA_CHUNK_CONFIG.systemPromptTokens || 0);
+
+		if (diffTokens > maxDiffTokensPerChunk) {
+			return {
+				estimatedTokens,
+				willChunk: true,
+				chunkCount: Math.ceil(diffTokens / maxDiffTokensPerChunk),
+			};
+		}
+	}
+
+	return {
+		estimatedTokens,
+		willChunk: false,
+		chunkCount: 0,
+	};
+}
+
 // IPC handler for calculating tokens with chunking info
 ipcMain.handle(
 	'calculate-tokens-with-chunking',
-	async (
+	(
 		_event: IpcMainInvokeEvent,
 		diff: string,
 		basePrompt: string,
 		userPrompt: string,
 		provider: 'ollama' | 'azure',
 		chunkConfig?: Partial<ChunkConfig>
-	): Promise<{
-		estimatedTokens: number;
-		willChunk: boolean;
-		chunkCount: number;
-	}> => {
-		const fullPrompt = buildPrompt(diff, basePrompt, userPrompt);
-		const estimatedTokens = countTokens(fullPrompt, 'cl100k_base');
+	): TokenEstimate => estimateTokensWithChunking(diff, basePrompt, userPrompt, provider, chunkConfig)
+);
 
-		// Only calculate chunking for Azure
-		if (provider === 'azure') {
-			// Calculate base prompt tokens (same logic as generateWithChunking)
-			const basePromptOnly = buildPrompt('', basePrompt, userPrompt);
-			const basePromptTokens = countTokens(basePromptOnly, 'cl100k_base');
+// Same estimate for a branch comparison, computed next to the diff so the (possibly multi-MB) text
+// is not copied to the renderer only to be sent straight back for tokenization
+// In-flight token estimate per window
+const activeDiffEstimates = new Map<number, AbortController>();
 
-			// Calculate chunk context overhead
-			const estimatedChunkContextTokens = 100;
+ipcMain.handle(
+	'calculate-diff-tokens',
+	async (
+		event: IpcMainInvokeEvent,
+		repoPath: string,
+		baseBranch: string,
+		targetBranch: string,
+		basePrompt: string,
+		userPrompt: string,
+		provider: 'ollama' | 'azure',
+		chunkConfig?: Partial<ChunkConfig>
+	): Promise<TokenEstimate & { hasChanges: boolean }> => {
+		// A newer estimate (e.g. the user picked another branch) supersedes this one; stop its git diff
+		const senderId = event.sender.id;
+		activeDiffEstimates.get(senderId)?.abort();
+		const controller = new AbortController();
+		activeDiffEstimates.set(senderId, controller);
 
-			// Configure chunking the same way as the actual generation
-			// Each chunk should be AT the rate limit
-			const rateLimitTokens = chunkConfig?.maxTokensPerChunk || DEFAULT_CHUNK_CONFIG.maxTokensPerChunk;
-			const maxDiffTokensPerChunk = rateLimitTokens - basePromptTokens - estimatedChunkContextTokens;
+		try {
+			const diff = await getReviewDiff(repoPath, baseBranch, targetBranch, controller.signal);
+			if (diff.trim() === '') {
+				return { estimatedTokens: 0, willChunk: false, chunkCount: 0, hasChanges: false };
+			}
 
-			console.log('[Chunking Calculation]', {
-				rateLimitTokens,
-				basePromptTokens,
-				estimatedChunkContextTokens,
-				maxDiffTokensPerChunk,
-				diffTokens: countTokens(diff, 'cl100k_base'),
+			return { ...estimateTokensWithChunking(diff, basePrompt, userPrompt, provider, chunkConfig), hasChanges: true };
+		} finally {
+			if (activeDiffEstimates.get(senderId) === controller) {
+				activeDiffEstimates.delete(senderId);
+			}
+		}
+	}
+);
+
+// Return a previous review of the exact same prompt instead of asking the model again.
+// skipCache (Regenerate) always asks the model and replaces the stored review.
+async function generateWithReviewCache(
+	event: IpcMainInvokeEvent,
+	progressChannel: string,
+	provider: string,
+	model: string,
+	prompt: string,
+	skipCache: boolean | undefined,
+	generate: () => Promise<string>
+): Promise<string> {
+	const key = getReviewCacheKey(provider, model, prompt);
+
+	const cached = skipCache ? null : readCachedReview(key);
+	if (cached !== null) {
+		if (!event.sender.isDestroyed()) {
+			event.sender.send(progressChannel, {
+				stage: 'complete',
+				progress: 100,
+				message: 'Loaded cached review for unchanged input',
+				timestamp: Date.now(),
+				isStreaming: false,
+				// No tokens were used; tells the renderer not to add the estimate to the totals
+				cached: true,
 			});
+		}
+		return cached;
+	}
 
-			const config: ChunkConfig = {
-				...DEFAULT_CHUNK_CONFIG,
-				maxTokensPerChunk: maxDiffTokensPerChunk,
-				systemPromptTokens: 0, // Already accounted for in maxDiffTokensPerChunk calculation
-			};
+	const review = await generate();
+	if (review) {
+		writeCachedReview(key, review);
+	}
+	return review;
+}
 
-			const willChunk = needsChunking(diff, config);
+ipcMain.handle('warmup-ollama', async (_event: IpcMainInvokeEvent, url: string, model: string): Promise<void> => {
+	return ollamaProvider.warmup(url, model);
+});
 
-			if (willChunk) {
-				// Simple calculation: total tokens / rate limit = number of chunks
-				const chunkCount = Math.ceil(estimatedTokens / rateLimitTokens);
+ipcMain.handle('list-ollama-models', async (_event: IpcMainInvokeEvent, url: string): Promise<string[]> => {
+	return ollamaProvider.listModels(url);
+});
 
-				console.log('[Chunking Result]', {
-					estimatedTokens,
-					rateLimitTokens,
-					chunkCount,
-				});
+// In-flight AI requests per renderer, so the Stop button can abort them.
+// At most one review runs per window: starting another aborts the previous one.
+const activeRequests = new Map<number, AbortController>();
 
-				return {
-					estimatedTokens,
-					willChunk: true,
-					chunkCount,
-				};
-			}
+async function runCancellable<T>(event: IpcMainInvokeEvent, run: (signal: AbortSignal) => Promise<T>): Promise<T> {
+	const sender = event.sender;
+	const senderId = sender.id;
+
+	activeRequests.get(senderId)?.abort();
+	const controller = new AbortController();
+	activeRequests.set(senderId, controller);
+
+	// Closing the window must not leave a long generation streaming into nowhere
+	const abortOnClose = () => controller.abort();
+	sender.once('destroyed', abortOnClose);
+
+	try {
+		return await run(controller.signal);
+	} finally {
+		sender.removeListener('destroyed', abortOnClose);
+		if (activeRequests.get(senderId) === controller) {
+			activeRequests.delete(senderId);
 		}
+	}
+}
 
-		return {
-			estimatedTokens,
-			willChunk: false,
-			chunkCount: 0,
-		};
+ipcMain.handle('cancel-ai-request', async (event: IpcMainInvokeEvent): Promise<{ success: boolean }> => {
+	const controller = activeRequests.get(event.sender.id);
+	if (!controller) {
+		return { success: false };
 	}
-);
+
+	controller.abort();
+	activeRequests.delete(event.sender.id);
+	return { success: true };
+});
 
 // IPC handlers for Ollama API
 ipcMain.handle('call-ollama-api', async (event: IpcMainInvokeEvent, config: OllamaConfig): Promise<string> => {
-	return ollamaProvider.generate(event, config);
+	return runCancellable(event, (signal) =>
+		generateWithReviewCache(event, 'ollama-progress', 'ollama', `${config.url}|${config.model}`, config.prompt, config.skipCache, () =>
+			ollamaProvider.generate(event, { ...config, signal })
+		)
+	);
+});
+
+ipcMain.handle('call-ollama-api-chunked', async (event: IpcMainInvokeEvent, config: OllamaChunkedConfig): Promise<string> => {
+	return runCancellable(event, (signal) => ollamaProvider.generateWithChunking(event, { ...config, signal }));
 });
 
 // IPC handlers for Azure AI API
 ipcMain.handle('call-azure-ai-api', async (event: IpcMainInvokeEvent, config: AzureOpenAIConfig): Promise<string> => {
-	return azureProvider.generate(event, config);
+	return runCancellable(event, (signal) =>
+		generateWithReviewCache(event, 'azure-ai-progress', 'azure', `${config.endpoint}|${config.deploymentName}`, config.prompt, config.skipCache, () =>
+			azureProvider.generate(event, { ...config, signal })
+		)
+	);
 });
 
 // IPC handler for Azure AI with automatic chunking
 ipcMain.handle('call-azure-ai-api-chunked', async (event: IpcMainInvokeEvent, config: AzureOpenAIConfig & { diff: string }): Promise<string> => {
 	const { diff, ...azureConfig } = config;
-	return azureProvider.generateWithChunking(event, azureConfig, diff);
+	return runCancellable(event, (signal) => azureProvider.generateWithChunking(event, { ...azureConfig, signal }, diff));
 });
 
 ipcMain.handle(
@@ -608,7 +897,7 @@ const activeWorktrees = new Set<string>();
 // IPC handlers for Git Worktree operations
 ipcMain.handle('create-worktree', async (_event: IpcMainInvokeEvent, repoPath: string, branch: string): Promise<WorktreeInfo> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
+		const git: SimpleGit = getGit(repoPath);
 
 		// Create unique temporary directory for worktree
 		const timestamp = Date.now();
@@ -617,14 +906,14 @@ ipcMain.handle('create-worktree', async (_event: IpcMainInvokeEvent, repoPath: s
 		console.log('Creating worktree:', { repoPath, branch, worktreePath });
 
 		// Check if the requested branch is the current branch
-		const currentBranch = await git.revparse(['--abbrev-ref', 'HEAD']);
+		const currentBranch = await getCurrentBranch(git, repoPath);
 		const normalizedBranch = branch.replace(/^remotes\/origin\//, '');
 
-		if (currentBranch.trim() === normalizedBranch) {
+		if (currentBranch === normalizedBranch) {
 			// Branch is currently checked out, use commit SHA instead
 			console.log('Branch is current branch, creating worktree from commit SHA:', { branch });
-			const commitSha = await git.revparse([branch]);
-			await git.raw(['worktree', 'add', worktreePath, commitSha.trim()]);
+			const commitSha = await resolveBranchSha(repoPath, branch);
+			await git.raw(['worktree', 'add', worktreePath, commitSha]);
 		} else {
 			// Create the worktree normally
 			await git.raw(['worktree', 'add', worktreePath, branch]);
@@ -674,7 +963,7 @@ ipcMain.handle('delete-worktree', async (_event: IpcMainInvokeEvent, worktreePat
 		const mainGitDir = match[1].split('/worktrees/')[0];
 		const repoPath = path.dirname(mainGitDir);
 
-		const git: SimpleGit = simpleGit(repoPath);
+		const git: SimpleGit = getGit(repoPath);
 
 		console.log('Deleting worktree:', worktreePath);
 
@@ -707,7 +996,7 @@ ipcMain.handle('delete-worktree', async (_event: IpcMainInvokeEvent, worktreePat
 
 ipcMain.handle('list-worktrees', async (_event: IpcMainInvokeEvent, repoPath: string): Promise<WorktreeInfo[]> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
+		const git: SimpleGit = getGit(repoPath);
 
 		// Get worktree list in porcelain format
 		const result = await git.raw(['worktree', 'list', '--porcelain']);
@@ -763,41 +1052,18 @@ ipcMain.handle('scan-worktree-files', async (_event: IpcMainInvokeEvent, worktre
 // Get list of changed files between branches (file names only, not full diff)
 ipcMain.handle('get-changed-files', async (_event: IpcMainInvokeEvent, repoPath: string, baseBranch: string, targetBranch: string): Promise<string[]> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
-
-		// Normalize branch names (same logic as get-git-diff)
-		const normalizeBranchName = (branchName: string): string => {
-			if (branchName.startsWith('remotes/origin/')) {
-				return branchName.replace('remotes/origin/', '');
-			}
-			if (branchName.startsWith('remotes/')) {
-				return branchName.replace(/^remotes\/[^/]+\//, '');
-			}
-			return branchName;
-		};
-
-		const branchExists = async (branchName: string): Promise<boolean> => {
-			try {
-				await git.revparse(['--verify', branchName]);
-				return true;
-			} catch {
-				return false;
-			}
-		};
+		const git: SimpleGit = getGit(repoPath);
 
-		const resolvedBaseBranch = (await branchExists(normalizeBranchName(baseBranch))) ? normalizeBranchName(baseBranch) : baseBranch;
-		const resolvedTargetBranch = (await branchExists(normalizeBranchName(targetBranch))) ? normalizeBranchName(targetBranch) : targetBranch;
+		const [targetSha, baseSha] = await Promise.all([resolveBranchSha(repoPath, targetBranch), resolveBranchSha(repoPath, baseBranch)]);
 
 		// Get list of changed files (--name-only shows just file paths)
-		const result = await git.raw(['diff', '--name-only', resolvedTargetBranch, resolvedBaseBranch]);
+		// Same merge-base comparison as get-git-diff, so the scanned files match the reviewed diff
+		// Deleted files can't be scanned, so only list paths that exist on the branch
+		const result = await git.raw(['diff', '--name-only', '-M', '--diff-filter=ACMRT', `${targetSha}...${baseSha}`, '--', ...DIFF_EXCLUDE_PATHSPECS]);
 
-		// Split by newlines and filter out empty lines
-		const changedFiles = result
-			.split('\n')
-			.map((file) => file.trim())
-			.filter((file) => file.length > 0);
+		const changedFiles = splitOutputLines(result);
 
-		console.log(`Found ${changedFiles.length} changed files between ${resolvedTargetBranch} and ${resolvedBaseBranch}`);
+		console.log(`Found ${changedFiles.length} changed files between ${targetBranch} and ${baseBranch}`);
 
 		return changedFiles;
 	} catch (error) {
@@ -824,16 +1090,13 @@ ipcMain.handle('scan-changed-files', async (_event: IpcMainInvokeEvent, worktree
 // Get uncommitted changes (working directory changes)
 ipcMain.handle('get-uncommitted-changes', async (_event: IpcMainInvokeEvent, repoPath: string): Promise<string[]> => {
 	try {
-		const git: SimpleGit = simpleGit(repoPath);
+		const git: SimpleGit = getGit(repoPath);
 
 		// Get both staged and unstaged changes
-		const result = await git.raw(['diff', '--name-only', 'HEAD']);
+		// Deleted files are gone from the working directory, so there is nothing to scan for them
+		const result = await git.raw(['diff', '--name-only', '-M', '--diff-filter=ACMRT', 'HEAD', '--', ...DIFF_EXCLUDE_PATHSPECS]);
 
-		// Split by newlines and filter out empty lines
-		const changedFiles = result
-			.split('\n')
-			.map((file) => file.trim())
-			.filter((file) => file.length > 0);
+		const changedFiles = splitOutputLines(result);
 
 		console.log(`Found ${changedFiles.length} uncommitted changed files`);
 
@@ -886,7 +1149,7 @@ async function cleanupWorktrees(): Promise<void> {
 			if (match) {
 				const mainGitDir = match[1].split('/worktrees/')[0];
 				const repoPath = path.dirname(mainGitDir);
-				const git: SimpleGit = simpleGit(repoPath);
+				const git: SimpleGit = getGit(repoPath);
 				await git.raw(['worktree', 'remove', worktreePath, '--force']);
 			}
 		} catch (error) {
@@ -911,6 +1174,14 @@ app.on('before-quit', async (event) => {
 	}
 });
 
+app.on('will-quit', () => {
+	for (const resolver of objectResolvers.values()) {
+		resolver.dispose();
+	}
+	objectResolvers.clear();
+	destroyHttpAgents();
+});
+
 app.on('window-all-closed', () => {
 	// Unregister all global shortcuts
 	try {
@@ -10,6 +10,8 @@ contextBridge.exposeInMainWorld('electronAPI', {
 
 	getCurrentBranch: (repoPath: string): Promise<string> => ipcRenderer.invoke('get-current-branch', repoPath),
 
+	branchExists: (repoPath: string, branchName: string): Promise<boolean> => ipcRenderer.invoke('branch-exists', repoPath, branchName),
+
 	gitFetch: (repoPath: string): Promise<GitOperationResult> => ipcRenderer.invoke('git-fetch', repoPath),
 
 	gitPull: (repoPath: string): Promise<GitOperationResult> => ipcRenderer.invoke('git-pull', repoPath),
@@ -17,7 +19,21 @@ contextBridge.exposeInMainWorld('electronAPI', {
 	getGitDiff: (repoPath: string, baseBranch: string, targetBranch: string): Promise<string> =>
 		ipcRenderer.invoke('get-git-diff', repoPath, baseBranch, targetBranch),
 
-	callOllamaAPI: (config: { url: string; model: string; prompt: string }): Promise<string> => ipcRenderer.invoke('call-ollama-api', config),
+	callOllamaAPI: (config: { url: string; model: string; prompt: string; skipCache?: boolean }): Promise<string> => ipcRenderer.invoke('call-ollama-api', config),
+
+	callOllamaAPIChunked: (config: {
+		url: string;
+		model: string;
+		diff: string;
+		basePrompt: string;
+		userPrompt: string;
+		maxTokensPerChunk?: number;
+		concurrency?: number;
+	}): Promise<string> => ipcRenderer.invoke('call-ollama-api-chunked', config),
+
+	warmupOllama: (url: string, model: string): Promise<void> => ipcRenderer.invoke('warmup-ollama', url, model),
+
+	listOllamaModels: (url: string): Promise<string[]> => ipcRenderer.invoke('list-ollama-models', url),
 
 	testOllamaConnection: (config: {
 		url: string;
@@ -30,7 +46,7 @@ contextBridge.exposeInMainWorld('electronAPI', {
 	}> => ipcRenderer.invoke('test-ollama-connection', config),
 
 	// Azure AI APIs
-	callAzureAI: (config: { endpoint: string; apiKey: string; deploymentName: string; prompt: string }): Promise<string> =>
+	callAzureAI: (config: { endpoint: string; apiKey: string; deploymentName: string; prompt: string; skipCache?: boolean }): Promise<string> =>
 		ipcRenderer.invoke('call-azure-ai-api', config),
 
 	callAzureAIChunked: (config: {
@@ -42,6 +58,8 @@ contextBridge.exposeInMainWorld('electronAPI', {
 		azureRateLimitTokensPerMinute?: number;
 	}): Promise<string> => ipcRenderer.invoke('call-azure-ai-api-chunked', config),
 
+	cancelAIRequest: (): Promise<{ success: boolean }> => ipcRenderer.invoke('cancel-ai-request'),
+
 	calculateTokensWithChunking: (
 		diff: string,
 		basePrompt: string,
@@ -54,6 +72,21 @@ contextBridge.exposeInMainWorld('electronAPI', {
 		chunkCount: number;
 	}> => ipcRenderer.invoke('calculate-tokens-with-chunking', diff, basePrompt, userPrompt, provider, chunkConfig),
 
+	calculateDiffTokens: (
+		repoPath: string,
+		baseBranch: string,
+		targetBranch: string,
+		basePrompt: string,
+		userPrompt: string,
+		provider: 'ollama' | 'azure',
+		chunkConfig?: { maxTokensPerChunk?: number; encoding?: 'cl100k_base' | 'o200k_base'; systemPromptTokens?: number }
+	): Promise<{
+		estimatedTokens: number;
+		willChunk: boolean;
+		chunkCount: number;
+		hasChanges: boolean;
+	}> => ipcRenderer.invoke('calculate-diff-tokens', repoPath, baseBranch, targetBranch, basePrompt, userPrompt, provider, chunkConfig),
+
 	testAzureAIConnection: (config: {
 		endpoint: string;
 		apiKey: string;
@@ -1,8 +1,16 @@
 import { IpcMainInvokeEvent } from 'electron';
-import OpenAI from 'openai';
-import { IAIProvider, AIProviderConfig, ProgressData } from './IAIProvider';
-import { countTokens } from '../utils/tokenEstimation';
+import type OpenAI from 'openai';
+import { IAIProvider, AIProviderConfig, ProgressData, REVIEW_CANCELLED_MESSAGE, NO_CHANGES_REVIEW } from './IAIProvider';
+import { countTokens, formatInteger } from '../utils/tokenEstimation';
 import { chunkDiff, needsChunking, getChunkMetadata, DiffChunk, DEFAULT_CHUNK_CONFIG } from '../utils/diffChunker';
+import { keepAliveHttpAgent, keepAliveHttpsAgent } from '../utils/httpAgents';
+
+// Live token counts while streaming use a length heuristic: re-tokenizing the whole response on every
+// update is quadratic. The exact count comes from the usage block (or one tokenizer pass) at the end
+const STREAMING_CHARS_PER_TOKEN = 4;
+
+// Minimum time between streaming progress messages; fast deployments emit many chunks per frame
+const PROGRESS_INTERVAL_MS = 100;
 
 /**
  * Azure OpenAI-specific configuration
@@ -21,6 +29,9 @@ export interface AzureOpenAIConfig extends AIProviderConfig {
 export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 	readonly name = 'azure';
 
+	// Clients are reused per endpoint/key/deployment so their pooled connections survive between reviews
+	private readonly clients = new Map<string, OpenAI>();
+
 	/**
 	 * Generate AI response using Azure OpenAI streaming API
 	 */
@@ -28,7 +39,8 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 		const { endpoint, apiKey, deploymentName, prompt } = config;
 
 		try {
-			const startTime = Date.now();
+			// Monotonic clock for durations and the progress throttle; Date.now() is only used for payload timestamps
+			const startTime = performance.now();
 			let totalTokens = 0;
 
 			// Send initial progress (unless suppressed for chunking)
@@ -51,7 +63,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 			}
 
 			// Create Azure OpenAI client
-			const client = this.createClient(endpoint, apiKey, deploymentName);
+			const client = await this.createClient(endpoint, apiKey, deploymentName);
 
 			if (!suppressProgress) {
 				this.sendProgress(event, {
@@ -63,25 +75,30 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 			}
 
 			// Make the streaming request to Azure OpenAI
-			const stream = await client.chat.completions.create({
-				model: deploymentName,
-				messages: [
-					{
-						role: 'system',
-						content: 'You are an expert code reviewer.',
-					},
-					{
-						role: 'user',
-						content: prompt,
-					},
-				],
-				temperature: 0.1,
-				max_tokens: 2000,
-				stream: true,
-			});
+			const stream = await client.chat.completions.create(
+				{
+					model: deploymentName,
+					messages: [
+						{
+							role: 'system',
+							content: 'You are an expert code reviewer.',
+						},
+						{
+							role: 'user',
+							content: prompt,
+						},
+					],
+					temperature: 0.1,
+					max_tokens: 2000,
+					stream: true,
+				},
+				{ signal: config.signal }
+			);
 
 			let responseText = '';
-			let chunkCount = 0;
+			// Text not yet forwarded to the renderer; slicing responseText instead would flatten it on every update
+			let unsentText = '';
+			let lastProgressUpdate = 0;
 			let usage = null;
 
 			// Process the stream
@@ -89,26 +106,28 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 				const delta = chunk.choices[0]?.delta?.content || '';
 				if (delta) {
 					responseText += delta;
-					chunkCount++;
+					unsentText += delta;
 
-					// Send streaming progress every few chunks (unless suppressed)
-					if (!suppressProgress && chunkCount % 3 === 0) {
-						const currentTime = Date.now();
+					// Send streaming progress at most every PROGRESS_INTERVAL_MS (unless suppressed)
+					const currentTime = performance.now();
+					if (!suppressProgress && currentTime - lastProgressUpdate >= PROGRESS_INTERVAL_MS) {
+						lastProgressUpdate = currentTime;
 						const elapsed = (currentTime - startTime) / 1000;
-						const estimatedTokens = countTokens(responseText, 'cl100k_base');
+						const estimatedTokens = Math.max(1, Math.round(responseText.length / STREAMING_CHARS_PER_TOKEN));
 						const tokensPerSecond = elapsed > 0 ? estimatedTokens / elapsed : 0;
 
 						this.sendProgress(event, {
 							stage: 'streaming',
 							progress: Math.min(60 + responseText.length / 50, 90),
 							message: `Receiving AI response... (${estimatedTokens} tokens, ${tokensPerSecond.toFixed(1)} t/s)`,
-							timestamp: currentTime,
-							streamingContent: responseText,
+							timestamp: Date.now(),
+							streamingDelta: unsentText,
 							isStreaming: true,
 							tokens: estimatedTokens,
 							tokensPerSecond: tokensPerSecond,
 							processingTime: elapsed,
 						});
+						unsentText = '';
 					}
 				}
 
@@ -118,7 +137,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 				}
 			}
 
-			const responseTime = Date.now() - startTime;
+			const responseTime = performance.now() - startTime;
 			totalTokens = usage?.completion_tokens || countTokens(responseText, 'cl100k_base');
 
 			if (!suppressProgress) {
@@ -139,6 +158,10 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 
 			return responseText;
 		} catch (error) {
+			if (config.signal?.aborted) {
+				throw new Error(REVIEW_CANCELLED_MESSAGE);
+			}
+
 			const err = error as Error & { code?: string; status?: number };
 			this.sendProgress(event, {
 				stage: 'error',
@@ -158,6 +181,11 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 	 * AI is instructed to wait until all chunks are received before responding
 	 */
 	async generateWithChunking(event: IpcMainInvokeEvent, config: AzureOpenAIConfig, diff: string): Promise<string> {
+		// An empty diff would still run a full inference on the bare prompt
+		if (!diff.trim()) {
+			return NO_CHANGES_REVIEW;
+		}
+
 		// Calculate base prompt tokens once (shared across all chunks)
 		const basePromptTokens = countTokens(config.prompt, 'cl100k_base');
 
@@ -187,7 +215,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 		this.sendProgress(event, {
 			stage: 'analyzing',
 			progress: 5,
-			message: `Large diff detected (${metadata.totalTokens.toLocaleString()} tokens). Splitting into ${metadata.estimatedChunks} chunks...`,
+			message: `Large diff detected (${formatInteger(metadata.totalTokens)} tokens). Splitting into ${metadata.estimatedChunks} chunks...`,
 			timestamp: Date.now(),
 		});
 
@@ -197,7 +225,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 		this.sendProgress(event, {
 			stage: 'chunking',
 			progress: 10,
-			message: `Processing ${chunks.length} chunks in threaded conversation (${chunks.reduce((sum, c) => sum + c.fileCount, 0)} files total, rate limit: ${(config.azureRateLimitTokensPerMinute || 95000).toLocaleString()} tokens/min)...`,
+			message: `Processing ${chunks.length} chunks in threaded conversation (${chunks.reduce((sum, c) => sum + c.fileCount, 0)} files total, rate limit: ${formatInteger(config.azureRateLimitTokensPerMinute || 95000)} tokens/min)...`,
 			timestamp: Date.now(),
 		});
 
@@ -205,7 +233,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 		const RATE_LIMIT_TOKENS = config.azureRateLimitTokensPerMinute || 95000; // Default: 95k to leave 5k margin from Azure's 100k limit
 		const RATE_LIMIT_WINDOW_MS = 60000; // 1 minute
 		let tokensInCurrentWindow = 0;
-		let windowStartTime = Date.now();
+		let windowStartTime = performance.now();
 
 		// Maintain conversation history for thread-based chunking
 		const conversationHistory: Array<{ role: 'system' | 'user' | 'assistant'; content: string }> = [
@@ -223,7 +251,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 		let cumulativeInputTokens = 0;
 
 		// Create Azure OpenAI client once for the entire conversation
-		const client = this.createClient(config.endpoint, config.apiKey, config.deploymentName);
+		const client = await this.createClient(config.endpoint, config.apiKey, config.deploymentName);
 
 		// Send all chunks in the same conversation thread
 		for (let i = 0; i < chunks.length; i++) {
@@ -234,13 +262,13 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 			const chunkTotalTokens = basePromptTokens + chunk.tokenCount;
 
 			// Check if we need to wait for rate limit window
-			const elapsedSinceWindowStart = Date.now() - windowStartTime;
+			const elapsedSinceWindowStart = performance.now() - windowStartTime;
 			if (tokensInCurrentWindow + chunkTotalTokens > RATE_LIMIT_TOKENS && elapsedSinceWindowStart < RATE_LIMIT_WINDOW_MS) {
 				const waitTime = RATE_LIMIT_WINDOW_MS - elapsedSinceWindowStart;
 				this.sendProgress(event, {
 					stage: 'rate-limit-wait',
 					progress: 10 + (i / chunks.length) * 70,
-					message: `Rate limit: waiting ${(waitTime / 1000).toFixed(0)}s before chunk ${i + 1}/${chunks.length} (${tokensInCurrentWindow.toLocaleString()}/${RATE_LIMIT_TOKENS.toLocaleString()} tokens used)...`,
+					message: `Rate limit: waiting ${(waitTime / 1000).toFixed(0)}s before chunk ${i + 1}/${chunks.length} (${formatInteger(tokensInCurrentWindow)}/${formatInteger(RATE_LIMIT_TOKENS)} tokens used)...`,
 					timestamp: Date.now(),
 					actualInputTokens: cumulativeInputTokens,
 				});
@@ -248,7 +276,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 				await this.delay(waitTime);
 
 				// Reset window
-				windowStartTime = Date.now();
+				windowStartTime = performance.now();
 				tokensInCurrentWindow = 0;
 			}
 
@@ -256,7 +284,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 			this.sendProgress(event, {
 				stage: 'processing-chunk',
 				progress: 10 + (i / chunks.length) * 70,
-				message: `Sending chunk ${i + 1}/${chunks.length} to thread (${chunk.fileCount} files, ${chunkTotalTokens.toLocaleString()} tokens)...`,
+				message: `Sending chunk ${i + 1}/${chunks.length} to thread (${chunk.fileCount} files, ${formatInteger(chunkTotalTokens)} tokens)...`,
 				timestamp: Date.now(),
 				actualInputTokens: cumulativeInputTokens,
 			});
@@ -271,18 +299,21 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 					content: chunkMessage,
 				});
 
-				const startTime = Date.now();
+				const startTime = performance.now();
 
 				// For all chunks except the last, request acknowledgment only
 				if (!isLastChunk) {
 					// Send chunk and get acknowledgment
-					const stream = await client.chat.completions.create({
-						model: config.deploymentName,
-						messages: conversationHistory,
-						temperature: 0.1,
-						max_tokens: 50, // Minimal tokens for acknowledgment
-						stream: true,
-					});
+					const stream = await client.chat.completions.create(
+						{
+							model: config.deploymentName,
+							messages: conversationHistory,
+							temperature: 0.1,
+							max_tokens: 50, // Minimal tokens for acknowledgment
+							stream: true,
+						},
+						{ signal: config.signal }
+					);
 
 					let ackText = '';
 					for await (const part of stream) {
@@ -296,20 +327,24 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 						content: ackText.trim() || 'Acknowledged.',
 					});
 
-					const duration = Date.now() - startTime;
+					const duration = performance.now() - startTime;
 					totalProcessingTime += duration;
 				} else {
 					// Last chunk: request full review response
-					const stream = await client.chat.completions.create({
-						model: config.deploymentName,
-						messages: conversationHistory,
-						temperature: 0.1,
-						max_tokens: 4000, // Full response for review
-						stream: true,
-					});
+					const stream = await client.chat.completions.create(
+						{
+							model: config.deploymentName,
+							messages: conversationHistory,
+							temperature: 0.1,
+							max_tokens: 4000, // Full response for review
+							stream: true,
+						},
+						{ signal: config.signal }
+					);
 
 					let responseText = '';
-					let chunkCount = 0;
+					let unsentText = '';
+					let lastProgressUpdate = 0;
 					let usage = null;
 
 					// Update progress to show we're generating the final response
@@ -326,26 +361,28 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 						const delta = part.choices[0]?.delta?.content || '';
 						if (delta) {
 							responseText += delta;
-							chunkCount++;
+							unsentText += delta;
 
-							// Send streaming progress every few chunks
-							if (chunkCount % 3 === 0) {
-								const currentTime = Date.now();
+							// Send streaming progress at most every PROGRESS_INTERVAL_MS
+							const currentTime = performance.now();
+							if (currentTime - lastProgressUpdate >= PROGRESS_INTERVAL_MS) {
+								lastProgressUpdate = currentTime;
 								const elapsed = (currentTime - startTime) / 1000;
-								const estimatedTokens = countTokens(responseText, 'cl100k_base');
+								const estimatedTokens = Math.max(1, Math.round(responseText.length / STREAMING_CHARS_PER_TOKEN));
 								const tokensPerSecond = elapsed > 0 ? estimatedTokens / elapsed : 0;
 
 								this.sendProgress(event, {
 									stage: 'streaming',
 									progress: Math.min(85 + responseText.length / 200, 98),
 									message: `Receiving final review... (${estimatedTokens} tokens, ${tokensPerSecond.toFixed(1)} t/s)`,
-									timestamp: currentTime,
-									streamingContent: responseText,
+									timestamp: Date.now(),
+									streamingDelta: unsentText,
 									isStreaming: true,
 									tokens: estimatedTokens,
 									tokensPerSecond: tokensPerSecond,
 									processingTime: elapsed,
 								});
+								unsentText = '';
 							}
 						}
 
@@ -355,7 +392,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 						}
 					}
 
-					const duration = Date.now() - startTime;
+					const duration = performance.now() - startTime;
 					totalProcessingTime += duration;
 
 					const totalTokens = usage?.completion_tokens || countTokens(responseText, 'cl100k_base');
@@ -401,12 +438,16 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 					await this.delay(60000); // Wait 60 seconds
 
 					// Reset window and retry
-					windowStartTime = Date.now();
+					windowStartTime = performance.now();
 					tokensInCurrentWindow = 0;
 					i--; // Retry this chunk
 					continue;
 				}
 
+				if (config.signal?.aborted) {
+					throw new Error(REVIEW_CANCELLED_MESSAGE);
+				}
+
 				// Re-throw other errors
 				throw error;
 			}
@@ -467,7 +508,7 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 
 		try {
 			// Create Azure OpenAI client
-			const client = this.createClient(endpoint, apiKey, deploymentName);
+			const client = await this.createClient(endpoint, apiKey, deploymentName);
 
 			// Test with a simple request
 			const testResponse = await client.chat.completions.create({
@@ -496,9 +537,18 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 	}
 
 	/**
-	 * Create OpenAI client configured for Azure
+	 * Create OpenAI client configured for Azure.
+	 * The SDK is imported on first use so Ollama-only sessions never load it at startup.
 	 */
-	private createClient(endpoint: string, apiKey: string, deploymentName: string): OpenAI {
+	private async createClient(endpoint: string, apiKey: string, deploymentName: string): Promise<OpenAI> {
+		const cacheKey = `${endpoint}\0${apiKey}\0${deploymentName}`;
+		const cachedClient = this.clients.get(cacheKey);
+		if (cachedClient) {
+			return cachedClient;
+		}
+
+		const { default: OpenAIClient } = await import('openai');
+
 		// Extract base URL from the full endpoint if it contains the full path
 		let baseURL = endpoint;
 		if (endpoint.includes('/openai/deployments/')) {
@@ -506,20 +556,26 @@ export class AzureOpenAIProvider implements IAIProvider<AzureOpenAIConfig> {
 			baseURL = endpoint.split('/openai/deployments/')[0];
 		}
 
-		return new OpenAI({
+		const client = new OpenAIClient({
 			apiKey: apiKey,
 			baseURL: `${baseURL}/openai/deployments/${deploymentName}`,
 			defaultQuery: { 'api-version': '2025-01-01-preview' },
 			defaultHeaders: {
 				'api-key': apiKey,
 			},
+			httpAgent: baseURL.startsWith('http:') ? keepAliveHttpAgent : keepAliveHttpsAgent,
 		});
+
+		this.clients.set(cacheKey, client);
+		return client;
 	}
 
 	/**
 	 * Send progress update to renderer process
 	 */
 	private sendProgress(event: IpcMainInvokeEvent, data: ProgressData): void {
+		// The window may have been closed while a stream was still running
+		if (event.sender.isDestroyed()) return;
 		event.sender.send('azure-ai-progress', data);
 	}
 
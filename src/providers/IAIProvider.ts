@@ -12,21 +12,44 @@ export interface ProgressData {
 	tokensPerSecond?: number;
 	processingTime?: number;
 	streamingContent?: string;
+	/** Text received since the previous progress update */
+	streamingDelta?: string;
 	isStreaming?: boolean;
 	bytesReceived?: number;
 	responseTime?: number;
 	actualInputTokens?: number;
 	actualOutputTokens?: number;
 	totalActualTokens?: number;
+	/** Set on the completion event of a review served from the cache */
+	cached?: boolean;
 	error?: string;
 	[key: string]: unknown;
 }
 
+/**
+ * Error message used when the user stops a running review
+ */
+export const REVIEW_CANCELLED_MESSAGE = 'Review cancelled';
+
+/**
+ * Error message used when the response stream ends before the model finished the review
+ */
+export const INCOMPLETE_REVIEW_MESSAGE = 'Incomplete response: the connection closed before the review finished';
+
+/**
+ * Review returned for an empty diff, without calling the model
+ */
+export const NO_CHANGES_REVIEW = '## No Changes Found\n\nNo differences were found between the selected branches.';
+
 /**
  * Base configuration interface for all AI providers
  */
 export interface AIProviderConfig {
 	prompt: string;
+	/** Aborts the request; attached by the main process, never sent over IPC */
+	signal?: AbortSignal;
+	/** Ask the model again instead of returning a cached review of the same prompt */
+	skipCache?: boolean;
 }
 
 /**
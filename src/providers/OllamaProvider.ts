@@ -1,7 +1,11 @@
 import { IpcMainInvokeEvent } from 'electron';
-import axios, { AxiosError } from 'axios';
-import { IAIProvider, AIProviderConfig, ProgressData } from './IAIProvider';
+import axios, { AxiosError, AxiosInstance, AxiosRequestConfig, AxiosResponse } from 'axios';
+import { StringDecoder } from 'string_decoder';
+import { IAIProvider, AIProviderConfig, ProgressData, REVIEW_CANCELLED_MESSAGE, INCOMPLETE_REVIEW_MESSAGE, NO_CHANGES_REVIEW } from './IAIProvider';
 import { countTokens } from '../utils/tokenEstimation';
+import { buildPrompt } from '../utils/prompts';
+import { chunkDiff, DiffChunk, ChunkConfig, OLLAMA_CHUNK_CONFIG } from '../utils/diffChunker';
+import { keepAliveHttpAgent, keepAliveHttpsAgent } from '../utils/httpAgents';
 
 /**
  * Ollama-specific configuration
@@ -11,6 +15,62 @@ export interface OllamaConfig extends AIProviderConfig {
 	model: string;
 }
 
+/**
+ * How long Ollama keeps the model loaded after a request, so back-to-back reviews skip the cold load
+ */
+const OLLAMA_KEEP_ALIVE = '30m';
+
+/**
+ * Sampling options matching the Azure provider (temperature 0.1, 2000 output tokens),
+ * so a rambling local model cannot stretch a review indefinitely
+ */
+const OLLAMA_OPTIONS = { temperature: 0.1, num_predict: 2000 };
+
+/**
+ * Sibling API URLs (e.g. /api/tags) per configured generate URL, derived once per distinct URL
+ */
+const apiUrlCache = new Map<string, { version: string; tags: string }>();
+
+function getOllamaApiUrls(generateUrl: string): { version: string; tags: string } {
+	let urls = apiUrlCache.get(generateUrl);
+	if (!urls) {
+		// Keep any path prefix (e.g. behind a reverse proxy); a URL that doesn't end in /api/generate
+		// falls back to the server root instead of silently producing an unchanged URL
+		const parsed = new URL(generateUrl);
+		const base = parsed.pathname.endsWith('/api/generate') ? parsed.pathname.slice(0, -'/api/generate'.length) : '';
+		const root = `${parsed.origin}${base}/api`;
+		urls = { version: `${root}/version`, tags: `${root}/tags` };
+		apiUrlCache.set(generateUrl, urls);
+	}
+	return urls;
+}
+
+/**
+ * Separator between the per-chunk reviews of a split diff
+ */
+const CHUNK_REVIEW_SEPARATOR = '\n\n---\n\n';
+
+/**
+ * Heading and review text for one part of a split diff
+ */
+function formatChunkReview(chunk: DiffChunk, totalChunks: number, review: string): string {
+	return `## Part ${chunk.chunkIndex + 1} of ${totalChunks}: ${chunk.files.join(', ')}\n\n${review.trim()}`;
+}
+
+/**
+ * Configuration for reviewing a large diff in several Ollama requests
+ */
+export interface OllamaChunkedConfig {
+	url: string;
+	model: string;
+	diff: string;
+	basePrompt: string;
+	userPrompt: string;
+	maxTokensPerChunk?: number;
+	concurrency?: number; // Number of chunk requests in flight at once (default: 2)
+	signal?: AbortSignal;
+}
+
 /**
  * Ollama AI provider implementation
  * Communicates with local Ollama API for AI responses
@@ -18,11 +78,17 @@ export interface OllamaConfig extends AIProviderConfig {
 export class OllamaProvider implements IAIProvider<OllamaConfig> {
 	readonly name = 'ollama';
 
+	// Keep-alive client so reviews, chunk requests and connection tests reuse open sockets
+	private readonly http: AxiosInstance = axios.create({
+		httpAgent: keepAliveHttpAgent,
+		httpsAgent: keepAliveHttpsAgent,
+	});
+
 	/**
 	 * Generate AI response using Ollama streaming API
 	 */
 	async generate(event: IpcMainInvokeEvent, config: OllamaConfig): Promise<string> {
-		const { url, model, prompt } = config;
+		const { url, model, prompt, signal } = config;
 
 		try {
 			// Send initial progress
@@ -33,13 +99,15 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 				timestamp: Date.now(),
 			});
 
-			const startTime = Date.now();
+			// Monotonic clock for durations and the progress throttle; Date.now() is only used for payload timestamps
+			const startTime = performance.now();
 			let totalTokens = 0;
 			let responseText = '';
 
-			// Calculate request size for data transfer tracking
-			const requestData = { model, prompt, stream: true };
-			const requestSize = JSON.stringify(requestData).length;
+			// Serialize the (potentially multi-MB) prompt once and send the bytes as-is,
+			// so axios neither re-stringifies nor re-parses it
+			const requestBody = Buffer.from(JSON.stringify({ model, prompt, stream: true, keep_alive: OLLAMA_KEEP_ALIVE, options: OLLAMA_OPTIONS }));
+			const requestSize = requestBody.length;
 
 			// Send request started progress
 			this.sendProgress(event, {
@@ -53,9 +121,11 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 			});
 
 			// Use /api/generate with stream: true for streaming responses
-			const response = await axios.post(url, requestData, {
-				timeout: 120000, // 2 minutes timeout
+			const response = await this.postWithRetry(url, requestBody, {
+				timeout: 120000, // 2 minutes without any data from the server
 				responseType: 'stream',
+				headers: { 'Content-Type': 'application/json' },
+				signal,
 			});
 
 			this.sendProgress(event, {
@@ -67,92 +137,116 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 
 			return new Promise<string>((resolve, reject) => {
 				let buffer = '';
-				let lastProgressUpdate = Date.now();
+				// Keeps multi-byte UTF-8 characters split across network chunks intact
+				const decoder = new StringDecoder('utf8');
+				let lastProgressUpdate = performance.now();
 				let bytesReceived = 0;
-
-				response.data.on('data', (chunk: Buffer) => {
-					const chunkSize = chunk.length;
-					bytesReceived += chunkSize;
-
-					buffer += chunk.toString();
-					const lines = buffer.split('\n');
-					buffer = lines.pop() || ''; // Keep incomplete line in buffer
-
-					lines.forEach((line) => {
-						if (line.trim()) {
-							try {
-								const data = JSON.parse(line) as {
-									response?: string;
-									done?: boolean;
-									prompt_eval_count?: number;
-									eval_count?: number;
-								};
-
-								if (data.response) {
-									responseText += data.response;
-									totalTokens++;
-
-									// Update progress every 100ms or every 10 tokens
-									const now = Date.now();
-									if (now - lastProgressUpdate > 100 || totalTokens % 10 === 0) {
-										const elapsed = (now - startTime) / 1000;
-										const tokensPerSecond = totalTokens / elapsed;
-
-										// Dynamic progress calculation based on response length
-										const estimatedTotalTokens = Math.max(100, countTokens(prompt, 'cl100k_base'));
-										const tokenProgress = Math.min(25, (totalTokens / estimatedTotalTokens) * 25);
-										const progress = Math.min(95, 60 + tokenProgress);
-
-										this.sendProgress(event, {
-											stage: 'streaming',
-											progress: progress,
-											message: `Receiving AI response... (${totalTokens} tokens, ${tokensPerSecond.toFixed(1)} t/s)`,
-											timestamp: now,
-											tokens: totalTokens,
-											tokensPerSecond: tokensPerSecond,
-											processingTime: elapsed,
-											streamingContent: responseText,
-											isStreaming: true,
-											bytesReceived: bytesReceived,
-										});
-
-										lastProgressUpdate = now;
-									}
-								}
-
-								if (data.done) {
-									const responseTime = Date.now() - startTime;
-
-									// Ollama provides actual token counts in the final response
-									const actualInputTokens = data.prompt_eval_count;
-									const actualOutputTokens = data.eval_count;
+				// Text not yet forwarded to the renderer. Kept separately because slicing it off
+				// responseText would flatten the whole growing string on every progress update
+				let unsentText = '';
+				// Progress scale for the streaming phase; tokenizing a multi-MB prompt is far too slow to repeat per update
+				const estimatedTotalTokens = Math.max(100, countTokens(prompt, 'cl100k_base'));
+				let settled = false;
+
+				const handleLine = (line: string) => {
+					if (line.trim()) {
+						try {
+							const data = JSON.parse(line) as {
+								response?: string;
+								done?: boolean;
+								prompt_eval_count?: number;
+								eval_count?: number;
+							};
+
+							if (data.response) {
+								responseText += data.response;
+								unsentText += data.response;
+								totalTokens++;
+
+								// Update progress at most every 100ms; a token-count trigger would fire many times per frame on fast models
+								const now = performance.now();
+								if (now - lastProgressUpdate >= 100) {
+									const elapsed = (now - startTime) / 1000;
+									const tokensPerSecond = totalTokens / elapsed;
+
+									// Dynamic progress calculation based on response length
+									const tokenProgress = Math.min(25, (totalTokens / estimatedTotalTokens) * 25);
+									const progress = Math.min(95, 60 + tokenProgress);
 
 									this.sendProgress(event, {
-										stage: 'complete',
-										progress: 100,
-										message: 'AI response complete',
+										stage: 'streaming',
+										progress: progress,
+										message: `Receiving AI response... (${totalTokens} tokens, ${tokensPerSecond.toFixed(1)} t/s)`,
 										timestamp: Date.now(),
-										responseTime,
-										tokens: actualOutputTokens || totalTokens,
-										tokensPerSecond: (actualOutputTokens || totalTokens) / (responseTime / 1000),
+										tokens: totalTokens,
+										tokensPerSecond: tokensPerSecond,
+										processingTime: elapsed,
+										streamingDelta: unsentText,
+										isStreaming: true,
 										bytesReceived: bytesReceived,
-										streamingContent: responseText,
-										isStreaming: false,
-										actualInputTokens: actualInputTokens,
-										actualOutputTokens: actualOutputTokens,
-										totalActualTokens: (actualInputTokens || 0) + (actualOutputTokens || 0),
 									});
 
-									resolve(responseText);
+									unsentText = '';
+									lastProgressUpdate = now;
 								}
-							} catch {
-								// Ignore JSON parse errors for partial chunks
 							}
+
+							if (data.done) {
+								const responseTime = performance.now() - startTime;
+
+								// Ollama provides actual token counts in the final response
+								const actualInputTokens = data.prompt_eval_count;
+								const actualOutputTokens = data.eval_count;
+
+								this.sendProgress(event, {
+									stage: 'complete',
+									progress: 100,
+									message: 'AI response complete',
+									timestamp: Date.now(),
+									responseTime,
+									tokens: actualOutputTokens || totalTokens,
+									tokensPerSecond: (actualOutputTokens || totalTokens) / (responseTime / 1000),
+									bytesReceived: bytesReceived,
+									streamingContent: responseText,
+									streamingDelta: unsentText,
+									isStreaming: false,
+									actualInputTokens: actualInputTokens,
+									actualOutputTokens: actualOutputTokens,
+									totalActualTokens: (actualInputTokens || 0) + (actualOutputTokens || 0),
+								});
+
+								settled = true;
+								resolve(responseText);
+							}
+						} catch {
+							// Ignore JSON parse errors for partial chunks
 						}
-					});
+					}
+				};
+
+				response.data.on('data', (chunk: Buffer) => {
+					const chunkSize = chunk.length;
+					bytesReceived += chunkSize;
+
+					buffer += decoder.write(chunk);
+
+					// Walk the complete lines in place instead of splitting the buffer into an array
+					let lineStart = 0;
+					let newline = buffer.indexOf('\n');
+					while (newline !== -1) {
+						handleLine(buffer.slice(lineStart, newline));
+						lineStart = newline + 1;
+						newline = buffer.indexOf('\n', lineStart);
+					}
+					buffer = buffer.slice(lineStart); // Keep incomplete line in buffer
 				});
 
 				response.data.on('error', (error: Error) => {
+					if (signal?.aborted) {
+						reject(new Error(REVIEW_CANCELLED_MESSAGE));
+						return;
+					}
+
 					this.sendProgress(event, {
 						stage: 'error',
 						progress: 0,
@@ -164,12 +258,41 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 				});
 
 				response.data.on('end', () => {
+					// The final line may arrive without a trailing newline
+					buffer += decoder.end();
+					if (buffer) {
+						handleLine(buffer);
+						buffer = '';
+					}
+					if (settled) return;
+
+					// Stream closed without a done message (e.g. server restart or proxy cut-off):
+					// settle now instead of leaving the review hanging, but as a failure so the
+					// truncated text is never cached or shown as a finished review
+					settled = true;
 					if (!responseText) {
 						reject(new Error('No response received from AI model'));
+						return;
 					}
+
+					// Forward the text still buffered here so the UI keeps everything that did arrive
+					this.sendProgress(event, {
+						stage: 'error',
+						progress: 0,
+						message: INCOMPLETE_REVIEW_MESSAGE,
+						timestamp: Date.now(),
+						streamingDelta: unsentText,
+						isStreaming: false,
+						error: INCOMPLETE_REVIEW_MESSAGE,
+					});
+					reject(new Error(INCOMPLETE_REVIEW_MESSAGE));
 				});
 			});
 		} catch (error) {
+			if (signal?.aborted) {
+				throw new Error(REVIEW_CANCELLED_MESSAGE);
+			}
+
 			const err = error as AxiosError;
 			this.sendProgress(event, {
 				stage: 'error',
@@ -183,6 +306,152 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 		}
 	}
 
+	/**
+	 * Generate a review for a large diff by splitting it into chunks and
+	 * reviewing them with a bounded number of concurrent requests
+	 */
+	async generateWithChunking(event: IpcMainInvokeEvent, config: OllamaChunkedConfig): Promise<string> {
+		const { url, model, diff, basePrompt, userPrompt, signal } = config;
+		// An empty diff would still run a full inference on the bare prompt
+		if (!diff.trim()) {
+			return NO_CHANGES_REVIEW;
+		}
+
+		const chunkConfig: ChunkConfig = {
+			...OLLAMA_CHUNK_CONFIG,
+			maxTokensPerChunk: config.maxTokensPerChunk || OLLAMA_CHUNK_CONFIG.maxTokensPerChunk,
+		};
+
+		const chunks = chunkDiff(diff, chunkConfig);
+		if (chunks.length <= 1) {
+			return this.generate(event, { url, model, prompt: buildPrompt(diff, basePrompt, userPrompt), signal });
+		}
+
+		const concurrency = Math.max(1, Math.min(config.concurrency || 2, chunks.length));
+		const startTime = performance.now();
+		const reviews: string[] = new Array(chunks.length);
+		let completed = 0;
+		let nextIndex = 0;
+		let inputTokens = 0;
+		let outputTokens = 0;
+
+		this.sendProgress(event, {
+			stage: 'chunking',
+			progress: 10,
+			message: `Large diff split into ${chunks.length} chunks, reviewing ${concurrency} at a time...`,
+			timestamp: Date.now(),
+		});
+
+		// Linked to the caller's signal, and aborted as soon as one chunk fails so the other
+		// workers stop instead of finishing requests whose results would be thrown away
+		const workerController = new AbortController();
+		const abortWorkers = () => workerController.abort();
+		if (signal?.aborted) {
+			abortWorkers();
+		}
+		signal?.addEventListener('abort', abortWorkers, { once: true });
+
+		// Each worker pulls the next pending chunk until none are left
+		const worker = async (): Promise<void> => {
+			while (nextIndex < chunks.length && !workerController.signal.aborted) {
+				const index = nextIndex++;
+				const chunk = chunks[index];
+				const prompt = buildPrompt(this.describeChunk(chunk, chunks.length) + chunk.content, basePrompt, userPrompt);
+				// Serialize once up front: axios would otherwise re-stringify the body on every retry attempt
+				const requestBody = Buffer.from(JSON.stringify({ model, prompt, stream: false, keep_alive: OLLAMA_KEEP_ALIVE, options: OLLAMA_OPTIONS }));
+
+				const response = await this.postWithRetry<{ response?: string; prompt_eval_count?: number; eval_count?: number }>(url, requestBody, {
+					timeout: 600000,
+					headers: { 'Content-Type': 'application/json' },
+					signal: workerController.signal,
+				});
+
+				reviews[index] = formatChunkReview(chunk, chunks.length, response.data.response || '');
+				inputTokens += response.data.prompt_eval_count || 0;
+				outputTokens += response.data.eval_count || 0;
+				completed++;
+
+				// Show each part as soon as it is done; chunks can finish out of order, and the
+				// final result (in chunk order) replaces the streamed text on completion
+				this.sendProgress(event, {
+					stage: 'processing-chunk',
+					progress: 10 + (completed / chunks.length) * 85,
+					message: `Reviewed chunk ${completed}/${chunks.length} (${chunk.fileCount} files)`,
+					timestamp: Date.now(),
+					tokens: outputTokens,
+					actualInputTokens: inputTokens,
+					streamingDelta: (completed > 1 ? CHUNK_REVIEW_SEPARATOR : '') + reviews[index],
+					isStreaming: true,
+				});
+			}
+		};
+
+		try {
+			await Promise.all(Array.from({ length: concurrency }, () => worker()));
+		} catch (error) {
+			abortWorkers();
+			if (signal?.aborted) {
+				throw new Error(REVIEW_CANCELLED_MESSAGE);
+			}
+
+			const err = error as AxiosError;
+			this.sendProgress(event, {
+				stage: 'error',
+				progress: 0,
+				message: `Error: ${err.message}`,
+				timestamp: Date.now(),
+				error: err.message,
+			});
+
+			throw new Error(this.formatError(err, model));
+		} finally {
+			signal?.removeEventListener('abort', abortWorkers);
+		}
+
+		const result = reviews.join(CHUNK_REVIEW_SEPARATOR);
+		const responseTime = performance.now() - startTime;
+
+		this.sendProgress(event, {
+			stage: 'complete',
+			progress: 100,
+			message: `Review complete (${chunks.length} chunks processed in ${(responseTime / 1000).toFixed(1)}s)`,
+			timestamp: Date.now(),
+			responseTime,
+			tokens: outputTokens,
+			tokensPerSecond: outputTokens / (responseTime / 1000),
+			actualInputTokens: inputTokens,
+			actualOutputTokens: outputTokens,
+			totalActualTokens: inputTokens + outputTokens,
+			isStreaming: false,
+		});
+
+		return result;
+	}
+
+	/**
+	 * Load the model into memory ahead of the first review.
+	 * A request without a prompt only loads the model; failures are ignored.
+	 */
+	async warmup(url: string, model: string): Promise<void> {
+		try {
+			await this.http.post(url, { model, keep_alive: OLLAMA_KEEP_ALIVE, stream: false }, { timeout: 120000 });
+		} catch (error) {
+			console.log('Ollama warm-up skipped:', (error as Error).message);
+		}
+	}
+
+	/**
+	 * List models installed on the Ollama server (empty if unreachable)
+	 */
+	async listModels(url: string): Promise<string[]> {
+		try {
+			const response = await this.http.get<{ models?: { name: string }[] }>(getOllamaApiUrls(url).tags, { timeout: 3000 });
+			return (response.data.models || []).map((m) => m.name);
+		} catch {
+			return [];
+		}
+	}
+
 	/**
 	 * Test connection to Ollama service
 	 */
@@ -195,25 +464,27 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 		const { url, model } = config;
 
 		try {
-			// Test server connection
-			const versionUrl = url.replace('/api/generate', '/api/version');
-			const versionResponse = await axios.get(versionUrl, { timeout: 5000 });
-
-			// Test model availability with a simple coding question
-			const testResponse = await axios.post<{ response?: string }>(
-				url,
-				{
-					model: model,
-					prompt: 'What is a function in programming? Please respond with one sentence.',
-					stream: false,
-				},
-				{ timeout: 15000 }
-			);
+			// Server version and installed models are cheap metadata calls; running a test generation here
+			// would cost a full model inference (and a cold model load) just to say "OK"
+			const apiUrls = getOllamaApiUrls(url);
+			const [versionResponse, tagsResponse] = await Promise.all([
+				this.http.get<{ version?: string }>(apiUrls.version, { timeout: 5000 }),
+				this.http.get<{ models?: { name: string }[] }>(apiUrls.tags, { timeout: 5000 }),
+			]);
+
+			// Ollama treats an untagged model name as ":latest"
+			const installed = new Set((tagsResponse.data.models || []).map((m) => m.name));
+			if (!installed.has(model) && !installed.has(`${model}:latest`)) {
+				return {
+					success: false,
+					error: `Model "${model}" not found. Please install it first:\n\nRun: ollama pull ${model}\n\nOr check available models: ollama list`,
+				};
+			}
 
 			return {
 				success: true,
 				version: versionResponse.data.version || 'Unknown',
-				modelResponse: testResponse.data.response || 'OK',
+				modelResponse: 'OK',
 			};
 		} catch (error) {
 			const err = error as AxiosError;
@@ -231,10 +502,40 @@ export class OllamaProvider implements IAIProvider<OllamaConfig> {
 		}
 	}
 
+	/**
+	 * POST with retry and exponential backoff for transient failures
+	 * (server not reachable yet, connection reset, 503 while a model loads)
+	 */
+	private async postWithRetry<T>(url: string, data: unknown, options: AxiosRequestConfig, attempts = 3): Promise<AxiosResponse<T>> {
+		for (let attempt = 1; ; attempt++) {
+			try {
+				return await this.http.post<T>(url, data, options);
+			} catch (error) {
+				const err = error as AxiosError;
+				const transient = err.response ? err.response.status === 503 : err.code === 'ECONNREFUSED' || err.code === 'ECONNRESET';
+
+				if (!transient || attempt >= attempts || options.signal?.aborted) {
+					throw error;
+				}
+
+				await new Promise((resolve) => setTimeout(resolve, 500 * 2 ** (attempt - 1)));
+			}
+		}
+	}
+
+	/**
+	 * Tell the model which part of a split diff it is looking at
+	 */
+	private describeChunk(chunk: DiffChunk, totalChunks: number): string {
+		return `(Part ${chunk.chunkIndex + 1} of ${totalChunks} of a larger diff, covering: ${chunk.files.join(', ')})\n\n`;
+	}
+
 	/**
 	 * Send progress update to renderer process
 	 */
 	private sendProgress(event: IpcMainInvokeEvent, data: ProgressData): void {
+		// The window may have been closed while a stream was still running
+		if (event.sender.isDestroyed()) return;
 		event.sender.send('ollama-progress', data);
 	}
 
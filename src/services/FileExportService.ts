@@ -15,6 +15,15 @@ export interface ExportMetadata {
 	source?: string;
 }
 
+type ExportFormat = NonNullable<ExportOptions['format']>;
+
+// Per-format file details, shared by filename generation and the download
+const FORMAT_FILE_TYPES: Record<ExportFormat, { mimeType: string; extension: string }> = {
+	markdown: { mimeType: 'text/markdown', extension: '.md' },
+	html: { mimeType: 'text/html', extension: '.html' },
+	txt: { mimeType: 'text/plain', extension: '.txt' },
+};
+
 export class FileExportService {
 	private static instance: FileExportService;
 
@@ -31,8 +40,7 @@ export class FileExportService {
 		const { filename = this.generateFilename(options.format || 'markdown', options.includeTimestamp), includeMetadata = false, format = 'markdown' } = options;
 
 		let exportContent = content;
-		let mimeType = 'text/plain';
-		let fileExtension = '.txt';
+		const { mimeType, extension: fileExtension } = FORMAT_FILE_TYPES[format] ?? FORMAT_FILE_TYPES.txt;
 
 		// Prepare content based on format
 		switch (format) {
@@ -40,20 +48,14 @@ export class FileExportService {
 				if (includeMetadata) {
 					exportContent = this.addMetadataToMarkdown(content);
 				}
-				mimeType = 'text/markdown';
-				fileExtension = '.md';
 				break;
 
 			case 'html':
 				exportContent = this.convertToHtml(content, includeMetadata);
-				mimeType = 'text/html';
-				fileExtension = '.html';
 				break;
 
 			case 'txt':
 				exportContent = this.convertToPlainText(content, includeMetadata);
-				mimeType = 'text/plain';
-				fileExtension = '.txt';
 				break;
 		}
 
@@ -98,10 +100,10 @@ export class FileExportService {
 		}
 	}
 
-	private generateFilename(format: string, includeTimestamp: boolean = true): string {
+	private generateFilename(format: ExportFormat, includeTimestamp: boolean = true): string {
 		const base = 'pr-review';
 		const timestamp = includeTimestamp ? `-${Date.now()}` : '';
-		const extension = format === 'markdown' ? '.md' : format === 'html' ? '.html' : '.txt';
+		const extension = (FORMAT_FILE_TYPES[format] ?? FORMAT_FILE_TYPES.txt).extension;
 		return `${base}${timestamp}${extension}`;
 	}
 
@@ -216,9 +218,7 @@ Generated by: PReviewer
 	private generateMetadata(content: string): ExportMetadata {
 		return {
 			exportDate: new Date().toLocaleString(),
-			wordCount: markdownRenderer.getWordCount(content),
-			characterCount: markdownRenderer.getCharacterCount(content),
-			estimatedReadingTime: markdownRenderer.getEstimatedReadingTime(content),
+			...markdownRenderer.getTextStats(content),
 		};
 	}
 
@@ -3,6 +3,17 @@ export interface RenderedMarkdown {
 	isUsingLibrary: boolean;
 }
 
+export interface TextStats {
+	wordCount: number;
+	characterCount: number;
+	estimatedReadingTime: number;
+}
+
+// Average reading speed
+const WORDS_PER_MINUTE = 200;
+
+const WORD_RE = /\S+/g;
+
 export class MarkdownRenderer {
 	private static instance: MarkdownRenderer;
 
@@ -112,8 +123,7 @@ export class MarkdownRenderer {
 	}
 
 	getWordCount(markdown: string): number {
-		const plainText = this.extractPlainText(markdown);
-		return plainText.split(/\s+/).filter((word) => word.length > 0).length;
+		return this.countWords(this.extractPlainText(markdown));
 	}
 
 	getCharacterCount(markdown: string): number {
@@ -121,9 +131,24 @@ export class MarkdownRenderer {
 	}
 
 	getEstimatedReadingTime(markdown: string): number {
-		const wordCount = this.getWordCount(markdown);
-		const wordsPerMinute = 200; // Average reading speed
-		return Math.ceil(wordCount / wordsPerMinute);
+		return Math.ceil(this.getWordCount(markdown) / WORDS_PER_MINUTE);
+	}
+
+	/**
+	 * Word count, character count and reading time from a single plain-text extraction
+	 */
+	getTextStats(markdown: string): TextStats {
+		const plainText = this.extractPlainText(markdown);
+		const wordCount = this.countWords(plainText);
+		return {
+			wordCount,
+			characterCount: plainText.length,
+			estimatedReadingTime: Math.ceil(wordCount / WORDS_PER_MINUTE),
+		};
+	}
+
+	private countWords(plainText: string): number {
+		return plainText.match(WORD_RE)?.length ?? 0;
 	}
 }
 
@@ -1,7 +1,7 @@
 import { AIProviderConfig } from '../types';
 import { buildPrompt } from '../utils/prompts';
 import { estimateTokens, countTokens } from '../utils/tokenEstimation';
-import { needsChunking, DEFAULT_CHUNK_CONFIG } from '../utils/diffChunker';
+import { needsChunking, DEFAULT_CHUNK_CONFIG, OLLAMA_CHUNK_CONFIG } from '../utils/diffChunker';
 
 export interface ReviewRequest {
 	repoPath: string;
@@ -84,7 +84,11 @@ export class ReviewService {
 			const fullPrompt = buildPrompt(diff, request.basePrompt, request.userPrompt);
 
 			if (request.debugMode) {
-				const diffLines = diff.split('\n').length;
+				// Count newlines in place rather than splitting a multi-MB diff into a throwaway array
+				let diffLines = 1;
+				for (let i = diff.indexOf('\n'); i !== -1; i = diff.indexOf('\n', i + 1)) {
+					diffLines++;
+				}
 				const diffSize = new TextEncoder().encode(diff).length;
 				const estimatedTokens = estimateTokens(fullPrompt);
 
@@ -116,11 +120,22 @@ export class ReviewService {
 
 				let response: string;
 				if (request.aiConfig.provider === 'ollama') {
-					response = await window.electronAPI.callOllamaAPI({
-						url: request.aiConfig.ollama.url,
-						model: request.aiConfig.ollama.model,
-						prompt: fullPrompt,
-					});
+					if (request.enableAutoChunking !== false && needsChunking(diff, OLLAMA_CHUNK_CONFIG)) {
+						// Review large diffs as several smaller requests running concurrently
+						response = await window.electronAPI.callOllamaAPIChunked({
+							url: request.aiConfig.ollama.url,
+							model: request.aiConfig.ollama.model,
+							diff: diff,
+							basePrompt: request.basePrompt,
+							userPrompt: request.userPrompt,
+						});
+					} else {
+						response = await window.electronAPI.callOllamaAPI({
+							url: request.aiConfig.ollama.url,
+							model: request.aiConfig.ollama.model,
+							prompt: fullPrompt,
+						});
+					}
 				} else {
 					// Check if Azure diff needs chunking
 					const chunkConfig = {
@@ -20,6 +20,7 @@ interface TokenState {
 	addToTotalOutputTokens: (tokens: number) => void;
 	setCurrentSessionInputTokens: (tokens: number) => void;
 	setCurrentSessionOutputTokens: (tokens: number) => void;
+	setCurrentSessionTokens: (inputTokens: number, outputTokens: number) => void;
 	setEstimatedInputTokens: (tokens: number) => void;
 	resetCurrentSession: () => void;
 
@@ -56,7 +57,22 @@ export const useTokenStore = create<TokenState>()(
 
 			setCurrentSessionOutputTokens: (tokens) => set({ currentSessionOutputTokens: tokens }),
 
-			setEstimatedInputTokens: (tokens) => set({ estimatedInputTokens: tokens }),
+			// Update both counters in one store write, so subscribers re-render once per progress event.
+			// Unchanged values skip set() entirely: persist rewrites localStorage on every set, even a no-op one
+			setCurrentSessionTokens: (inputTokens, outputTokens) => {
+				const state = get();
+				if (state.currentSessionInputTokens === inputTokens && state.currentSessionOutputTokens === outputTokens) return;
+
+				set({
+					currentSessionInputTokens: inputTokens,
+					currentSessionOutputTokens: outputTokens,
+				});
+			},
+
+			setEstimatedInputTokens: (tokens) => {
+				if (get().estimatedInputTokens === tokens) return;
+				set({ estimatedInputTokens: tokens });
+			},
 
 			resetCurrentSession: () =>
 				set({
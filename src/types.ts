@@ -55,6 +55,10 @@ export interface ProgressData extends Record<string, unknown> {
 	stage?: string;
 	message?: string;
 	progress?: number;
+	streamingDelta?: string;
+	isStreaming?: boolean;
+	/** Set on the completion event of a review served from the cache */
+	cached?: boolean;
 }
 
 export interface GitOperationResult {
@@ -93,17 +97,29 @@ declare global {
 			selectDirectory: () => Promise<string | null>;
 			getGitBranches: (repoPath: string) => Promise<string[]>;
 			getCurrentBranch: (repoPath: string) => Promise<string>;
+			branchExists: (repoPath: string, branchName: string) => Promise<boolean>;
 			gitFetch: (repoPath: string) => Promise<GitOperationResult>;
 			gitPull: (repoPath: string) => Promise<GitOperationResult>;
 			getGitDiff: (repoPath: string, fromBranch: string, toBranch: string) => Promise<string>;
-			callOllamaAPI: (config: { url: string; model: string; prompt: string }) => Promise<string>;
+			callOllamaAPI: (config: { url: string; model: string; prompt: string; skipCache?: boolean }) => Promise<string>;
+			callOllamaAPIChunked: (config: {
+				url: string;
+				model: string;
+				diff: string;
+				basePrompt: string;
+				userPrompt: string;
+				maxTokensPerChunk?: number;
+				concurrency?: number;
+			}) => Promise<string>;
+			warmupOllama: (url: string, model: string) => Promise<void>;
+			listOllamaModels: (url: string) => Promise<string[]>;
 			testOllamaConnection: (config: { url: string; model: string }) => Promise<{
 				success: boolean;
 				error?: string;
 				version?: string;
 				modelResponse?: string;
 			}>;
-			callAzureAI: (config: { endpoint: string; apiKey: string; deploymentName: string; prompt: string }) => Promise<string>;
+			callAzureAI: (config: { endpoint: string; apiKey: string; deploymentName: string; prompt: string; skipCache?: boolean }) => Promise<string>;
 			callAzureAIChunked: (config: {
 				endpoint: string;
 				apiKey: string;
@@ -112,6 +128,7 @@ declare global {
 				diff: string;
 				azureRateLimitTokensPerMinute?: number;
 			}) => Promise<string>;
+			cancelAIRequest: () => Promise<{ success: boolean }>;
 			calculateTokensWithChunking: (
 				diff: string,
 				basePrompt: string,
@@ -123,6 +140,20 @@ declare global {
 				willChunk: boolean;
 				chunkCount: number;
 			}>;
+			calculateDiffTokens: (
+				repoPath: string,
+				fromBranch: string,
+				toBranch: string,
+				basePrompt: string,
+				userPrompt: string,
+				provider: 'ollama' | 'azure',
+				chunkConfig?: { maxTokensPerChunk?: number; encoding?: 'cl100k_base' | 'o200k_base'; systemPromptTokens?: number }
+			) => Promise<{
+				estimatedTokens: number;
+				willChunk: boolean;
+				chunkCount: number;
+				hasChanges: boolean;
+			}>;
 			testAzureAIConnection: (config: { endpoint: string; apiKey: string; deploymentName: string }) => Promise<{
 				success: boolean;
 				error?: string;
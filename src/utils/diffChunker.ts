@@ -41,6 +41,35 @@ export const DEFAULT_CHUNK_CONFIG: ChunkConfig = {
 	systemPromptTokens: 1000, // Reserve for system prompt and overhead
 };
 
+/**
+ * Default chunk configuration for local Ollama models
+ * Keeps each request well inside a typical 8k context window
+ */
+export const OLLAMA_CHUNK_CONFIG: ChunkConfig = {
+	maxTokensPerChunk: 8000,
+	encoding: 'cl100k_base',
+	systemPromptTokens: 1500, // Reserve for the review prompt and the model's answer
+};
+
+/**
+ * Extract the file name from a "diff --git" header, with or without a/ b/ prefixes
+ */
+function getDiffFileName(header: string): string {
+	const paths = header.slice('diff --git '.length);
+
+	// Unrenamed files repeat the same path twice ("x x" or "a/x b/x"), which also handles spaces in names
+	const middle = (paths.length - 1) / 2;
+	if (paths[middle] === ' ') {
+		const oldPath = paths.slice(0, middle);
+		const newPath = paths.slice(middle + 1);
+		if (oldPath === newPath) return oldPath;
+		if (oldPath.startsWith('a/') && newPath.startsWith('b/') && oldPath.slice(2) === newPath.slice(2)) return newPath.slice(2);
+	}
+
+	const match = /^a\/(.*?) b\//.exec(paths);
+	return match ? match[1] : paths.split(' ')[0] || 'unknown';
+}
+
 /**
  * Parse a git diff into individual file diffs
  */
@@ -54,7 +83,7 @@ function parseDiffIntoFiles(diff: string): DiffFile[] {
 
 	for (const line of lines) {
 		// Check for new file header (diff --git or diff command)
-		if (line.startsWith('diff --git') || (line.startsWith('diff ') && line.includes(' '))) {
+		if (line.startsWith('diff ')) {
 			// Save previous file if exists
 			if (currentFile) {
 				currentFile.content = currentContent.join('\n');
@@ -62,8 +91,7 @@ function parseDiffIntoFiles(diff: string): DiffFile[] {
 			}
 
 			// Extract filename from diff header
-			const match = line.match(/diff --git a\/(.*?) b\//);
-			currentFileName = match ? match[1] : line.split(' ')[1] || 'unknown';
+			currentFileName = line.startsWith('diff --git ') ? getDiffFileName(line) : line.split(' ')[1] || 'unknown';
 
 			// Start new file
 			currentFile = {
@@ -176,10 +204,15 @@ function splitLargeFile(file: DiffFile, maxTokens: number, encoding: 'cl100k_bas
 	const chunks: DiffFile[] = [];
 	const lines = file.content.split('\n');
 
+	// Every chunk repeats the header, so count it once
+	const headerTokens = countTokens(file.header, encoding);
+
 	let currentChunk: string[] = [file.header];
-	let currentTokens = countTokens(file.header, encoding);
+	let currentTokens = headerTokens;
 
-	for (const line of lines.slice(1)) {
+	// Line 0 is the header itself; index from 1 instead of copying the array with slice
+	for (let i = 1; i < lines.length; i++) {
+		const line = lines[i];
 		const lineTokens = countTokens(line, encoding);
 
 		if (currentTokens + lineTokens > maxTokens && currentChunk.length > 1) {
@@ -193,7 +226,7 @@ function splitLargeFile(file: DiffFile, maxTokens: number, encoding: 'cl100k_bas
 
 			// Start new chunk with header
 			currentChunk = [file.header, line];
-			currentTokens = countTokens(file.header, encoding) + lineTokens;
+			currentTokens = headerTokens + lineTokens;
 		} else {
 			currentChunk.push(line);
 			currentTokens += lineTokens;
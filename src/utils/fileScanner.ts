@@ -10,14 +10,41 @@ const DEFAULT_OPTIONS: Required<ScanOptions> = {
 };
 
 /**
- * Check if a path matches any of the exclude patterns
+ * Compile glob patterns into one anchored regex, so each path is tested with a single match
  */
-function matchesPattern(filePath: string, patterns: string[]): boolean {
-	return patterns.some((pattern) => {
-		// Convert glob pattern to regex (simple implementation)
-		const regex = new RegExp(pattern.replace(/\*\*/g, '.*').replace(/\*/g, '[^/]*').replace(/\?/g, '.'));
-		return regex.test(filePath);
-	});
+function compileGlobs(patterns: string[]): RegExp | null {
+	if (patterns.length === 0) return null;
+
+	const sources = patterns.map((pattern) =>
+		pattern
+			.split(/(\*\*\/|\/\*\*|\*\*|\*|\?)/)
+			.map((part) => {
+				switch (part) {
+					case '**/':
+						return '(?:.*/)?'; // zero or more leading directories
+					case '/**':
+						return '(?:/.*)?'; // the directory itself or anything below it
+					case '**':
+						return '.*';
+					case '*':
+						return '[^/]*';
+					case '?':
+						return '[^/]';
+					default:
+						return part.replace(/[.+^${}()|[\]\\]/g, '\\$&');
+				}
+			})
+			.join('')
+	);
+	return new RegExp(`^(?:${sources.join('|')})$`);
+}
+
+/**
+ * Check if a path matches the compiled exclude patterns
+ */
+function matchesPattern(relativePath: string, pattern: RegExp | null): boolean {
+	// Globs use forward slashes; path.relative returns backslashes on Windows
+	return pattern !== null && pattern.test(path.sep === '/' ? relativePath : relativePath.split(path.sep).join('/'));
 }
 
 /**
@@ -31,7 +58,13 @@ function hasValidExtension(filePath: string, includePatterns: string[]): boolean
 /**
  * Recursively scan a directory and collect files
  */
-async function scanDirectory(dirPath: string, baseDir: string, options: Required<ScanOptions>, scannedFiles: ScannedFile[]): Promise<void> {
+async function scanDirectory(
+	dirPath: string,
+	baseDir: string,
+	options: Required<ScanOptions>,
+	excludePattern: RegExp | null,
+	scannedFiles: ScannedFile[]
+): Promise<void> {
 	// Stop if we've reached the file limit
 	if (scannedFiles.length >= options.maxTotalFiles) {
 		return;
@@ -45,13 +78,13 @@ async function scanDirectory(dirPath: string, baseDir: string, options: Required
 			const relativePath = path.relative(baseDir, fullPath);
 
 			// Check exclude patterns
-			if (matchesPattern(relativePath, options.excludePatterns)) {
+			if (matchesPattern(relativePath, excludePattern)) {
 				continue;
 			}
 
 			if (entry.isDirectory()) {
 				// Recursively scan subdirectories
-				await scanDirectory(fullPath, baseDir, options, scannedFiles);
+				await scanDirectory(fullPath, baseDir, options, excludePattern, scannedFiles);
 			} else if (entry.isFile()) {
 				// Check if we've hit the file limit
 				if (scannedFiles.length >= options.maxTotalFiles) {
@@ -108,7 +141,7 @@ export async function scanWorktree(worktreePath: string, options: Partial<ScanOp
 	console.log('Scanning worktree:', worktreePath);
 	console.log('Options:', mergedOptions);
 
-	await scanDirectory(worktreePath, worktreePath, mergedOptions, scannedFiles);
+	await scanDirectory(worktreePath, worktreePath, mergedOptions, compileGlobs(mergedOptions.excludePatterns), scannedFiles);
 
 	console.log(`Scanned ${scannedFiles.length} files from worktree`);
 
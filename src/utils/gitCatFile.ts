@@ -0,0 +1,98 @@
+import { spawn, ChildProcessByStdio } from 'child_process';
+import { Readable, Writable } from 'stream';
+
+// stdin and stdout are piped; stderr goes nowhere
+type CatFileProcess = ChildProcessByStdio<Writable, Readable, null>;
+
+interface PendingQuery {
+	resolve: (line: string) => void;
+	reject: (error: Error) => void;
+}
+
+/**
+ * Long-lived `git cat-file --batch-check` process for one repository.
+ * Each lookup is a line written to stdin and a line read back, so resolving
+ * revisions costs a pipe round-trip instead of spawning a new git process.
+ */
+export class GitObjectResolver {
+	private child: CatFileProcess | null = null;
+	private pending: PendingQuery[] = [];
+	private buffer = '';
+
+	constructor(private readonly repoPath: string) {}
+
+	/**
+	 * Resolve a revision (branch, tag, SHA...) to its commit SHA, or null if it doesn't exist
+	 */
+	async resolveCommit(revision: string): Promise<string | null> {
+		// Output is "<sha> <type> <size>", or "<input> missing" / "<input> ambiguous"
+		const line = await this.query(`${revision}^{commit}`);
+		const [sha, type] = line.split(' ');
+		return type === 'commit' ? sha : null;
+	}
+
+	/**
+	 * Stop the helper process; the next lookup starts a fresh one
+	 */
+	dispose(): void {
+		if (this.child) {
+			this.child.stdin.end();
+			this.child.kill();
+			this.child = null;
+		}
+		this.failPending(new Error('git cat-file helper was closed'));
+	}
+
+	private query(input: string): Promise<string> {
+		if (input.includes('\n')) {
+			return Promise.reject(new Error(`Invalid revision: ${JSON.stringify(input)}`));
+		}
+
+		const child = this.ensureProcess();
+		return new Promise<string>((resolve, reject) => {
+			this.pending.push({ resolve, reject });
+			child.stdin.write(`${input}\n`);
+		});
+	}
+
+	private ensureProcess(): CatFileProcess {
+		if (this.child) return this.child;
+
+		const child = spawn('git', ['cat-file', '--batch-check'], { cwd: this.repoPath, windowsHide: true, stdio: ['pipe', 'pipe', 'ignore'] });
+		child.stdout.setEncoding('utf8');
+
+		child.stdout.on('data', (data: string) => {
+			this.buffer += data;
+			let newline = this.buffer.indexOf('\n');
+			while (newline !== -1) {
+				const line = this.buffer.slice(0, newline);
+				this.buffer = this.buffer.slice(newline + 1);
+				this.pending.shift()?.resolve(line);
+				newline = this.buffer.indexOf('\n');
+			}
+		});
+
+		const handleExit = (error: Error) => {
+			if (this.child === child) {
+				this.child = null;
+			}
+			this.buffer = '';
+			this.failPending(error);
+		};
+		child.on('error', handleExit);
+		child.on('close', (code) => handleExit(new Error(`git cat-file exited with code ${code}`)));
+		// Writes after the process died surface here; the close/error handlers already reject the callers
+		child.stdin.on('error', () => {});
+
+		this.child = child;
+		return child;
+	}
+
+	private failPending(error: Error): void {
+		const pending = this.pending;
+		this.pending = [];
+		for (const query of pending) {
+			query.reject(error);
+		}
+	}
+}
@@ -0,0 +1,118 @@
+import { spawn } from 'child_process';
+
+/**
+ * Generated or vendored files that only add noise (and tokens) to a review.
+ * Exclude-only pathspecs; a bare '*' also matches across directories.
+ */
+export const DIFF_EXCLUDE_PATHSPECS = [
+	':(exclude)*package-lock.json',
+	':(exclude)*yarn.lock',
+	':(exclude)*pnpm-lock.yaml',
+	':(exclude)*packages.lock.json',
+	':(exclude)*.min.js',
+	':(exclude)*.min.css',
+	':(exclude)*.map',
+];
+
+/**
+ * Split line-oriented git output (e.g. --name-only) into non-empty, trimmed lines in one pass
+ */
+export function splitOutputLines(output: string): string[] {
+	const lines: string[] = [];
+	for (const line of output.split('\n')) {
+		const trimmed = line.trim();
+		if (trimmed) {
+			lines.push(trimmed);
+		}
+	}
+	return lines;
+}
+
+export interface GitStreamOptions {
+	/** Stop reading (and kill git) once this many bytes of stdout have been received */
+	maxBytes?: number;
+	/** Kill git and reject when aborted, e.g. because the result is no longer wanted */
+	signal?: AbortSignal;
+}
+
+export interface GitStreamResult {
+	output: string;
+	truncated: boolean;
+	bytes: number;
+}
+
+/**
+ * Run a git command and collect stdout as raw Buffer chunks, decoding once at the end.
+ * Unlike simple-git's raw(), output beyond maxBytes is never buffered: git is killed
+ * as soon as the limit is reached and the result is cut at the last complete line.
+ */
+export function runGitStreaming(repoPath: string, args: string[], options: GitStreamOptions = {}): Promise<GitStreamResult> {
+	const maxBytes = options.maxBytes ?? Infinity;
+	const { signal } = options;
+
+	return new Promise<GitStreamResult>((resolve, reject) => {
+		if (signal?.aborted) {
+			reject(new Error(`git ${args[0]} cancelled`));
+			return;
+		}
+
+		const child = spawn('git', args, { cwd: repoPath, windowsHide: true, stdio: ['ignore', 'pipe', 'pipe'] });
+
+		const onAbort = () => child.kill();
+		signal?.addEventListener('abort', onAbort, { once: true });
+
+		const chunks: Buffer[] = [];
+		const stderrChunks: Buffer[] = [];
+		let bytes = 0;
+		let truncated = false;
+
+		child.stdout.on('data', (chunk: Buffer) => {
+			if (truncated) return;
+
+			if (bytes + chunk.length > maxBytes) {
+				chunks.push(chunk.subarray(0, maxBytes - bytes));
+				bytes = maxBytes;
+				truncated = true;
+				child.kill();
+				return;
+			}
+
+			chunks.push(chunk);
+			bytes += chunk.length;
+		});
+
+		child.stderr.on('data', (chunk: Buffer) => {
+			stderrChunks.push(chunk);
+		});
+
+		child.on('error', (error) => {
+			signal?.removeEventListener('abort', onAbort);
+			reject(error);
+		});
+
+		child.on('close', (code) => {
+			signal?.removeEventListener('abort', onAbort);
+			if (signal?.aborted) {
+				reject(new Error(`git ${args[0]} cancelled`));
+				return;
+			}
+
+			if (!truncated && code !== 0) {
+				const stderr = Buffer.concat(stderrChunks).toString('utf8').trim();
+				reject(new Error(stderr || `git ${args[0]} exited with code ${code}`));
+				return;
+			}
+
+			let data = Buffer.concat(chunks, bytes);
+			if (truncated) {
+				// Drop the partial last line so we never hand out half a diff line or UTF-8 sequence
+				const lastNewline = data.lastIndexOf(0x0a);
+				if (lastNewline >= 0) {
+					data = data.subarray(0, lastNewline + 1);
+				}
+			}
+
+			resolve({ output: data.toString('utf8'), truncated, bytes: data.length });
+		});
+	});
+}
@@ -0,0 +1,133 @@
+import path from 'path';
+import fs from 'fs/promises';
+
+/**
+ * Locations of a repository's git metadata. For linked worktrees HEAD lives in
+ * gitDir while branches and packed-refs are shared through commonDir.
+ */
+export interface GitDirs {
+	gitDir: string;
+	commonDir: string;
+}
+
+async function statMtime(filePath: string): Promise<number> {
+	try {
+		return (await fs.stat(filePath)).mtimeMs;
+	} catch {
+		return 0;
+	}
+}
+
+// Branch names with slashes live in nested directories, whose mtimes change independently of refs/heads
+async function collectDirMtimes(dir: string, mtimes: number[]): Promise<void> {
+	let entries;
+	try {
+		entries = await fs.readdir(dir, { withFileTypes: true });
+	} catch {
+		return;
+	}
+
+	mtimes.push(await statMtime(dir));
+	await Promise.all(entries.filter((entry) => entry.isDirectory()).map((entry) => collectDirMtimes(path.join(dir, entry.name), mtimes)));
+}
+
+/**
+ * Build a cheap fingerprint of the local branch list from file modification times.
+ * Creating, deleting or packing branches, or switching HEAD, changes the stamp.
+ */
+export async function getBranchRefsStamp(dirs: GitDirs): Promise<string> {
+	const dirMtimes: number[] = [];
+	const [headMtime, packedRefsMtime] = await Promise.all([
+		statMtime(path.join(dirs.gitDir, 'HEAD')),
+		statMtime(path.join(dirs.commonDir, 'packed-refs')),
+		collectDirMtimes(path.join(dirs.commonDir, 'refs', 'heads'), dirMtimes),
+	]);
+
+	dirMtimes.sort((a, b) => a - b);
+	return [headMtime, packedRefsMtime, ...dirMtimes].join(':');
+}
+
+// Loose refs are plain files under refs/heads; nested directories hold names with slashes
+async function collectLooseBranches(dir: string, prefix: string, names: string[]): Promise<void> {
+	const entries = await fs.readdir(dir, { withFileTypes: true });
+	await Promise.all(
+		entries.map(async (entry) => {
+			if (entry.isDirectory()) {
+				await collectLooseBranches(path.join(dir, entry.name), `${prefix}${entry.name}/`, names);
+			} else if (entry.isFile() && !entry.name.endsWith('.lock')) {
+				names.push(prefix + entry.name);
+			}
+		})
+	);
+}
+
+const PACKED_HEAD_MARKER = Buffer.from(' refs/heads/');
+
+/**
+ * Extract branch names from packed-refs ("<sha> refs/heads/<name>" lines). The file is scanned
+ * as raw bytes and only the branch names are decoded, since in large repositories it is
+ * dominated by tag and remote-tracking refs we never need as strings.
+ */
+export function parsePackedBranches(packedRefs: Buffer): string[] {
+	const names: string[] = [];
+	let markerIndex = packedRefs.indexOf(PACKED_HEAD_MARKER);
+
+	while (markerIndex !== -1) {
+		const lineStart = packedRefs.lastIndexOf(0x0a, markerIndex) + 1;
+		let lineEnd = packedRefs.indexOf(0x0a, markerIndex);
+		if (lineEnd === -1) lineEnd = packedRefs.length;
+
+		// Skip the "# pack-refs with:" header and "^<sha>" peeled-tag lines
+		const firstByte = packedRefs[lineStart];
+		if (firstByte !== 0x23 && firstByte !== 0x5e) {
+			let nameEnd = lineEnd;
+			if (packedRefs[nameEnd - 1] === 0x0d) nameEnd--;
+			names.push(packedRefs.toString('utf8', markerIndex + PACKED_HEAD_MARKER.length, nameEnd));
+		}
+
+		markerIndex = packedRefs.indexOf(PACKED_HEAD_MARKER, lineEnd);
+	}
+
+	return names;
+}
+
+/**
+ * List local branch names by reading refs/heads and packed-refs directly, without spawning git.
+ * Returns null when the layout is not readable (e.g. reftable repositories) so callers can fall back to git.
+ */
+export async function readLocalBranches(dirs: GitDirs): Promise<string[] | null> {
+	const names: string[] = [];
+
+	try {
+		await collectLooseBranches(path.join(dirs.commonDir, 'refs', 'heads'), '', names);
+	} catch {
+		return null;
+	}
+
+	try {
+		names.push(...parsePackedBranches(await fs.readFile(path.join(dirs.commonDir, 'packed-refs'))));
+	} catch {
+		// No packed-refs file: every branch is a loose ref
+	}
+
+	return [...new Set(names)].sort();
+}
+
+/**
+ * Read the checked-out branch name from HEAD, matching `git rev-parse --abbrev-ref HEAD`
+ * ('HEAD' when detached). Returns null when HEAD can't be read so callers can fall back to git.
+ */
+export async function readCurrentBranch(dirs: GitDirs): Promise<string | null> {
+	let head: string;
+	try {
+		head = (await fs.readFile(path.join(dirs.gitDir, 'HEAD'), 'utf8')).trim();
+	} catch {
+		return null;
+	}
+
+	if (head.startsWith('ref: refs/heads/')) {
+		return head.slice('ref: refs/heads/'.length);
+	}
+	// A bare commit SHA means a detached HEAD; anything else (other ref namespaces) is left to git
+	return /^[0-9a-f]{40,64}$/.test(head) ? 'HEAD' : null;
+}
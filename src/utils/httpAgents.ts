@@ -0,0 +1,17 @@
+import http from 'http';
+import https from 'https';
+
+/**
+ * Process-wide keep-alive agents shared by all AI providers, so repeated
+ * requests to the same host reuse pooled sockets instead of reconnecting.
+ */
+export const keepAliveHttpAgent = new http.Agent({ keepAlive: true, maxSockets: 10 });
+export const keepAliveHttpsAgent = new https.Agent({ keepAlive: true, maxSockets: 10 });
+
+/**
+ * Close pooled sockets; called on quit so idle keep-alive connections don't linger
+ */
+export function destroyHttpAgents(): void {
+	keepAliveHttpAgent.destroy();
+	keepAliveHttpsAgent.destroy();
+}
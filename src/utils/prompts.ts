@@ -72,34 +72,42 @@ export function buildPrompt(diff: string, basePrompt: string | null = null, user
 		prompt += '\n\nAdditional Instructions:\n' + userPrompt.trim();
 	}
 
-	prompt += '\n---\nDiff:\n{diff}\n---\nReview:\n';
-
-	return prompt.replace('{diff}', diff);
+	// Concatenate instead of String.replace: no extra scan of the template, and
+	// "$&"/"$1" sequences inside the diff are not treated as replacement patterns
+	return prompt + '\n---\nDiff:\n' + diff + '\n---\nReview:\n';
 }
 
+// Code fence languages for extensions whose name differs from the highlighter's language id
+const FENCE_LANGUAGE_ALIASES = new Map<string, string>([
+	['tsx', 'typescript'],
+	['jsx', 'typescript'],
+	['cs', 'csharp'],
+]);
+
 export function buildWorktreePrompt(
 	files: { path: string; relativePath: string; content: string; extension: string }[],
 	basePrompt: string | null = null,
 	userPrompt: string | null = null
 ): string {
-	let prompt = basePrompt || DEFAULT_WORKTREE_PROMPT;
+	// Collect every section and join once: file contents can be large, and repeated += would
+	// build a deep rope that gets flattened again when the prompt is serialized
+	const parts: string[] = [basePrompt || DEFAULT_WORKTREE_PROMPT];
 
 	if (userPrompt && userPrompt.trim()) {
-		prompt += '\n\nAdditional Instructions:\n' + userPrompt.trim();
+		parts.push('\n\nAdditional Instructions:\n', userPrompt.trim());
 	}
 
-	prompt += '\n---\nSource Files:\n\n';
+	parts.push('\n---\nSource Files:\n\n');
 
 	for (const file of files) {
 		// Determine language for syntax highlighting
-		let language = file.extension.replace('.', '');
-		if (language === 'tsx' || language === 'jsx') language = 'typescript';
-		if (language === 'cs') language = 'csharp';
+		const extension = file.extension.replace('.', '');
+		const language = FENCE_LANGUAGE_ALIASES.get(extension) ?? extension;
 
-		prompt += `### File: ${file.relativePath}\n\`\`\`${language}\n${file.content}\n\`\`\`\n\n`;
+		parts.push(`### File: ${file.relativePath}\n\`\`\`${language}\n`, file.content, '\n```\n\n');
 	}
 
-	prompt += '---\nReview:\n';
+	parts.push('---\nReview:\n');
 
-	return prompt;
+	return parts.join('');
 }
@@ -0,0 +1,47 @@
+import crypto from 'crypto';
+
+/**
+ * Maximum number of reviews kept in memory
+ */
+const MAX_CACHED_REVIEWS = 50;
+
+/**
+ * Reviews by cache key, least recently used first. Kept in memory only, so model
+ * output never outlives the session.
+ */
+const reviewCache = new Map<string, string>();
+
+/**
+ * Build a cache key from everything that determines the model output
+ */
+export function getReviewCacheKey(provider: string, model: string, prompt: string): string {
+	return crypto.createHash('sha256').update(provider).update('\0').update(model).update('\0').update(prompt).digest('hex');
+}
+
+/**
+ * Read a cached review, or null if there is none
+ */
+export function readCachedReview(key: string): string | null {
+	const review = reviewCache.get(key);
+	if (review === undefined) {
+		return null;
+	}
+
+	// Re-insert so the entry moves to the most recently used end
+	reviewCache.delete(key);
+	reviewCache.set(key, review);
+	return review;
+}
+
+/**
+ * Store a review and drop the least recently used entries beyond MAX_CACHED_REVIEWS
+ */
+export function writeCachedReview(key: string, review: string): void {
+	reviewCache.delete(key);
+	reviewCache.set(key, review);
+
+	for (const oldestKey of reviewCache.keys()) {
+		if (reviewCache.size <= MAX_CACHED_REVIEWS) break;
+		reviewCache.delete(oldestKey);
+	}
+}
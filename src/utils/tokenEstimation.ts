@@ -51,10 +51,13 @@ export function estimateTokens(text: string): number {
 	return countTokens(text, 'cl100k_base');
 }
 
+// Classifies a line in one scan, ignoring surrounding whitespace: diff markers, plain prose, or (no match) code
+const LINE_KIND_RE = /^\s*(?:(?<diff>[+-]|@@)|(?<text>[a-zA-Z.,!?'"][a-zA-Z\s.,!?'"]*$))/;
+
 /**
  * Fallback estimation method (kept for backward compatibility and error cases)
  */
-function estimateTokensFallback(text: string): number {
+export function estimateTokensFallback(text: string): number {
 	const characterCount = text.length;
 	const lines = text.split('\n');
 	const wordCount = text.split(/\s+/).filter((word) => word.length > 0).length;
@@ -64,10 +67,10 @@ function estimateTokensFallback(text: string): number {
 	let naturalTextRatio = 0;
 
 	lines.forEach((line) => {
-		const trimmed = line.trim();
-		if (trimmed.startsWith('+') || trimmed.startsWith('-') || trimmed.startsWith('@@')) {
+		const match = LINE_KIND_RE.exec(line);
+		if (match?.groups?.diff !== undefined) {
 			diffRatio += line.length;
-		} else if (/^[a-zA-Z\s.,!?'"]+$/.test(trimmed)) {
+		} else if (match?.groups?.text !== undefined) {
 			naturalTextRatio += line.length;
 		} else {
 			codeRatio += line.length;
@@ -128,6 +131,16 @@ export function formatDuration(seconds: number): string {
 	}
 }
 
+// One shared formatter; Number#toLocaleString builds a new one on every call
+const integerFormat = new Intl.NumberFormat();
+
+/**
+ * Format an integer with locale grouping separators (e.g. 12,345)
+ */
+export function formatInteger(value: number): string {
+	return integerFormat.format(value);
+}
+
 export function formatTokenCount(count: number): string {
 	if (count < 1000) {
 		return count.toString();
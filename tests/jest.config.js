@@ -45,6 +45,15 @@ module.exports = {
 			testMatch: ['<rootDir>/unit/**/*.test.js'],
 			testEnvironment: 'node',
 			setupFilesAfterEnv: ['<rootDir>/setup.js'],
+			// Unit tests load the TypeScript sources from src/ directly
+			transform: {
+				'^.+\\.(js|ts)$': [
+					'babel-jest',
+					{
+						presets: [['@babel/preset-env', { targets: { node: 'current' } }], '@babel/preset-typescript'],
+					},
+				],
+			},
 		},
 		{
 			displayName: 'integration',
@@ -19,6 +19,7 @@ jest.mock('../../src/store/tokenStore', () => ({
 		setEstimatedInputTokens: jest.fn(),
 		setCurrentSessionInputTokens: jest.fn(),
 		setCurrentSessionOutputTokens: jest.fn(),
+		setCurrentSessionTokens: jest.fn(),
 		addToTotalInputTokens: jest.fn(),
 		addToTotalOutputTokens: jest.fn(),
 		resetCurrentSession: jest.fn(),
@@ -172,6 +173,27 @@ describe('React Components', () => {
 			expect(mockOnExportOutput).toHaveBeenCalled();
 		});
 
+		test('should call onRegenerate when regenerate button is clicked', async () => {
+			const user = userEvent.setup();
+			const mockOnRegenerate = jest.fn();
+
+			render(<OutputSection {...defaultProps} outputContent="Previous review" onRegenerate={mockOnRegenerate} />);
+
+			await user.click(screen.getByRole('button', { name: /regenerate/i }));
+
+			expect(mockOnRegenerate).toHaveBeenCalled();
+		});
+
+		test('should disable regenerate while there is no review or one is streaming', () => {
+			const { rerender } = render(<OutputSection {...defaultProps} onRegenerate={jest.fn()} />);
+
+			expect(screen.getByRole('button', { name: /regenerate/i })).toBeDisabled();
+
+			rerender(<OutputSection {...defaultProps} outputContent="Partial review" isStreaming onRegenerate={jest.fn()} />);
+
+			expect(screen.getByRole('button', { name: /regenerate/i })).toBeDisabled();
+		});
+
 		test('should display output content when provided', () => {
 			const outputContent = '# Test Output\n\nThis is test content.';
 
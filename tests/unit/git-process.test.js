@@ -0,0 +1,93 @@
+// Unit tests for running git with streamed, size-capped output
+
+const path = require('path');
+const { execFileSync } = require('child_process');
+const fs = require('fs-extra');
+const tmp = require('tmp');
+const { runGitStreaming, splitOutputLines } = require('../../src/utils/gitProcess');
+
+describe('Git Process', () => {
+	describe('splitOutputLines', () => {
+		test('should return trimmed, non-empty lines', () => {
+			expect(splitOutputLines('src/a.ts\nsrc/b.ts\n')).toEqual(['src/a.ts', 'src/b.ts']);
+		});
+
+		test('should strip CRLF line endings and surrounding whitespace', () => {
+			expect(splitOutputLines('  src/a.ts\r\nsrc/b.ts  \r\n')).toEqual(['src/a.ts', 'src/b.ts']);
+		});
+
+		test('should skip blank lines', () => {
+			expect(splitOutputLines('\nsrc/a.ts\n\n   \nsrc/b.ts')).toEqual(['src/a.ts', 'src/b.ts']);
+		});
+
+		test('should return an empty list for empty output', () => {
+			expect(splitOutputLines('')).toEqual([]);
+			expect(splitOutputLines('\n\r\n')).toEqual([]);
+		});
+	});
+
+	describe('runGitStreaming', () => {
+		// 100 lines of 10 bytes each
+		const content = Array.from({ length: 100 }, (_, i) => `line ${String(i).padStart(4, '0')}\n`).join('');
+		let tempDir;
+		let blobSha;
+
+		beforeEach(async () => {
+			tempDir = tmp.dirSync({ unsafeCleanup: true });
+			execFileSync('git', ['init', '-q'], { cwd: tempDir.name });
+			await fs.writeFile(path.join(tempDir.name, 'lines.txt'), content);
+			blobSha = execFileSync('git', ['hash-object', '-w', 'lines.txt'], { cwd: tempDir.name, encoding: 'utf8' }).trim();
+		});
+
+		afterEach(() => {
+			tempDir.removeCallback();
+		});
+
+		test('should return the complete output', async () => {
+			const result = await runGitStreaming(tempDir.name, ['cat-file', '-p', blobSha]);
+
+			expect(result).toEqual({ output: content, truncated: false, bytes: content.length });
+		});
+
+		test('should cut truncated output at the last complete line', async () => {
+			const result = await runGitStreaming(tempDir.name, ['cat-file', '-p', blobSha], { maxBytes: 25 });
+
+			expect(result.truncated).toBe(true);
+			expect(result.output).toBe('line 0000\nline 0001\n');
+			expect(result.bytes).toBe(20);
+		});
+
+		test('should keep a line that ends exactly at the limit', async () => {
+			const result = await runGitStreaming(tempDir.name, ['cat-file', '-p', blobSha], { maxBytes: 30 });
+
+			expect(result.truncated).toBe(true);
+			expect(result.output).toBe('line 0000\nline 0001\nline 0002\n');
+		});
+
+		test('should not truncate output that fits the limit', async () => {
+			const result = await runGitStreaming(tempDir.name, ['cat-file', '-p', blobSha], { maxBytes: content.length });
+
+			expect(result.truncated).toBe(false);
+			expect(result.output).toBe(content);
+		});
+
+		test('should reject with git stderr on failure', async () => {
+			await expect(runGitStreaming(tempDir.name, ['cat-file', '-p', '0'.repeat(40)])).rejects.toThrow(/fatal/);
+		});
+
+		test('should reject without starting git when already aborted', async () => {
+			const controller = new AbortController();
+			controller.abort();
+
+			await expect(runGitStreaming(tempDir.name, ['cat-file', '-p', blobSha], { signal: controller.signal })).rejects.toThrow('git cat-file cancelled');
+		});
+
+		test('should reject when aborted while running', async () => {
+			const controller = new AbortController();
+			const pending = runGitStreaming(tempDir.name, ['cat-file', '-p', blobSha], { signal: controller.signal });
+			controller.abort();
+
+			await expect(pending).rejects.toThrow('git cat-file cancelled');
+		});
+	});
+});
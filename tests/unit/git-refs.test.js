@@ -0,0 +1,178 @@
+// Unit tests for reading branch refs straight from the .git directory
+
+const path = require('path');
+const fs = require('fs-extra');
+const tmp = require('tmp');
+const { parsePackedBranches, readCurrentBranch, readLocalBranches, getBranchRefsStamp } = require('../../src/utils/gitRefs');
+
+const SHA_A = 'a'.repeat(40);
+const SHA_B = 'b'.repeat(40);
+
+describe('Git Refs', () => {
+	describe('parsePackedBranches', () => {
+		test('should return local branch names', () => {
+			const packedRefs = Buffer.from(`${SHA_A} refs/heads/main\n${SHA_B} refs/heads/feature/login\n`);
+
+			expect(parsePackedBranches(packedRefs)).toEqual(['main', 'feature/login']);
+		});
+
+		test('should skip the header, tags and remote-tracking refs', () => {
+			const packedRefs = Buffer.from(
+				[
+					'# pack-refs with: peeled fully-peeled sorted refs/heads/',
+					`${SHA_A} refs/heads/main`,
+					`${SHA_B} refs/remotes/origin/main`,
+					`${SHA_A} refs/tags/v1.0`,
+					'',
+				].join('\n')
+			);
+
+			expect(parsePackedBranches(packedRefs)).toEqual(['main']);
+		});
+
+		test('should skip peeled lines', () => {
+			const packedRefs = Buffer.from(`${SHA_A} refs/tags/v1.0\n^${SHA_B} refs/heads/not-a-branch\n${SHA_B} refs/heads/develop\n`);
+
+			expect(parsePackedBranches(packedRefs)).toEqual(['develop']);
+		});
+
+		test('should strip CRLF line endings', () => {
+			const packedRefs = Buffer.from(`${SHA_A} refs/heads/main\r\n${SHA_B} refs/heads/develop\r\n`);
+
+			expect(parsePackedBranches(packedRefs)).toEqual(['main', 'develop']);
+		});
+
+		test('should read a last line without a trailing newline', () => {
+			const packedRefs = Buffer.from(`${SHA_A} refs/heads/main\n${SHA_B} refs/heads/release`);
+
+			expect(parsePackedBranches(packedRefs)).toEqual(['main', 'release']);
+		});
+
+		test('should decode non-ASCII branch names', () => {
+			const packedRefs = Buffer.from(`${SHA_A} refs/heads/fix/über-ümlaut\n`);
+
+			expect(parsePackedBranches(packedRefs)).toEqual(['fix/über-ümlaut']);
+		});
+
+		test('should return an empty list when there are no branches', () => {
+			expect(parsePackedBranches(Buffer.alloc(0))).toEqual([]);
+			expect(parsePackedBranches(Buffer.from(`# pack-refs with: peeled\n${SHA_A} refs/tags/v1.0\n`))).toEqual([]);
+		});
+	});
+
+	describe('with a git directory', () => {
+		let tempDir;
+		let dirs;
+
+		beforeEach(async () => {
+			tempDir = tmp.dirSync({ unsafeCleanup: true });
+			dirs = { gitDir: tempDir.name, commonDir: tempDir.name };
+			await fs.ensureDir(path.join(tempDir.name, 'refs', 'heads'));
+		});
+
+		afterEach(() => {
+			tempDir.removeCallback();
+		});
+
+		describe('readCurrentBranch', () => {
+			test('should return the checked-out branch', async () => {
+				await fs.writeFile(path.join(tempDir.name, 'HEAD'), 'ref: refs/heads/feature/login\n');
+
+				expect(await readCurrentBranch(dirs)).toBe('feature/login');
+			});
+
+			test('should strip CRLF line endings', async () => {
+				await fs.writeFile(path.join(tempDir.name, 'HEAD'), 'ref: refs/heads/main\r\n');
+
+				expect(await readCurrentBranch(dirs)).toBe('main');
+			});
+
+			test("should return 'HEAD' when detached", async () => {
+				await fs.writeFile(path.join(tempDir.name, 'HEAD'), `${SHA_A}\n`);
+
+				expect(await readCurrentBranch(dirs)).toBe('HEAD');
+			});
+
+			test('should return null for refs outside refs/heads', async () => {
+				await fs.writeFile(path.join(tempDir.name, 'HEAD'), 'ref: refs/remotes/origin/main\n');
+
+				expect(await readCurrentBranch(dirs)).toBeNull();
+			});
+
+			test('should return null when HEAD is missing', async () => {
+				expect(await readCurrentBranch(dirs)).toBeNull();
+			});
+		});
+
+		describe('readLocalBranches', () => {
+			test('should merge loose and packed branches without duplicates', async () => {
+				await fs.ensureDir(path.join(tempDir.name, 'refs', 'heads', 'feature'));
+				await fs.writeFile(path.join(tempDir.name, 'refs', 'heads', 'main'), `${SHA_A}\n`);
+				await fs.writeFile(path.join(tempDir.name, 'refs', 'heads', 'feature', 'login'), `${SHA_B}\n`);
+				await fs.writeFile(path.join(tempDir.name, 'refs', 'heads', 'main.lock'), `${SHA_B}\n`);
+				await fs.writeFile(path.join(tempDir.name, 'packed-refs'), `# pack-refs with: peeled\n${SHA_A} refs/heads/main\n${SHA_B} refs/heads/develop\n`);
+
+				expect(await readLocalBranches(dirs)).toEqual(['develop', 'feature/login', 'main']);
+			});
+
+			test('should return null when refs/heads is missing', async () => {
+				await fs.remove(path.join(tempDir.name, 'refs'));
+
+				expect(await readLocalBranches(dirs)).toBeNull();
+			});
+		});
+
+		describe('getBranchRefsStamp', () => {
+			// Push a file's mtime forward so the change is visible regardless of timestamp resolution
+			const touch = async (filePath, seconds) => {
+				const time = new Date(Date.now() + seconds * 1000);
+				await fs.utimes(filePath, time, time);
+			};
+
+			beforeEach(async () => {
+				await fs.writeFile(path.join(tempDir.name, 'HEAD'), 'ref: refs/heads/main\n');
+			});
+
+			test('should be stable while nothing changes', async () => {
+				expect(await getBranchRefsStamp(dirs)).toBe(await getBranchRefsStamp(dirs));
+			});
+
+			test('should change when HEAD changes', async () => {
+				const before = await getBranchRefsStamp(dirs);
+				await touch(path.join(tempDir.name, 'HEAD'), 10);
+
+				expect(await getBranchRefsStamp(dirs)).not.toBe(before);
+			});
+
+			test('should change when packed-refs is written', async () => {
+				const before = await getBranchRefsStamp(dirs);
+				await fs.writeFile(path.join(tempDir.name, 'packed-refs'), `${SHA_A} refs/heads/main\n`);
+				await touch(path.join(tempDir.name, 'packed-refs'), 10);
+
+				expect(await getBranchRefsStamp(dirs)).not.toBe(before);
+			});
+
+			test('should change when a nested branch directory changes', async () => {
+				const featureDir = path.join(tempDir.name, 'refs', 'heads', 'feature');
+				await fs.ensureDir(featureDir);
+				const before = await getBranchRefsStamp(dirs);
+				await touch(featureDir, 10);
+
+				expect(await getBranchRefsStamp(dirs)).not.toBe(before);
+			});
+
+			test('should read HEAD from gitDir and refs from commonDir', async () => {
+				const worktreeGitDir = path.join(tempDir.name, 'worktrees', 'feature');
+				await fs.ensureDir(worktreeGitDir);
+				await fs.writeFile(path.join(worktreeGitDir, 'HEAD'), `${SHA_A}\n`);
+				const worktreeDirs = { gitDir: worktreeGitDir, commonDir: tempDir.name };
+
+				const before = await getBranchRefsStamp(worktreeDirs);
+				await touch(path.join(worktreeGitDir, 'HEAD'), 10);
+
+				expect(await getBranchRefsStamp(worktreeDirs)).not.toBe(before);
+				expect(await readCurrentBranch(worktreeDirs)).toBe('HEAD');
+			});
+		});
+	});
+});
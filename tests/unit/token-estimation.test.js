@@ -2,7 +2,9 @@
 
 // Import the utility functions from mocks
 const { estimateTokens, formatTokenCount } = require('../mocks/tokenEstimation.js');
-const { buildPrompt, DEFAULT_BASE_PROMPT } = require('../mocks/prompts.js');
+// The prompt builder and the heuristic fallback are tested against the real implementation
+const { buildPrompt, DEFAULT_BASE_PROMPT } = require('../../src/utils/prompts');
+const { estimateTokensFallback } = require('../../src/utils/tokenEstimation');
 
 // Add createMockDiff function locally
 function createMockDiff(type = 'mixed') {
@@ -239,6 +241,49 @@ session-based authentication, which improves security and scalability.`;
 			expect(result).toContain(`Diff:\n${testDiff}\n`);
 			expect(result).not.toContain('{diff}');
 		});
+
+		test('should keep replacement patterns in the diff verbatim', () => {
+			const testDiff = "+ const s = text.replace(/x/g, '$&$1$$');";
+			const result = buildPrompt(testDiff);
+
+			expect(result).toContain(`Diff:\n${testDiff}\n`);
+		});
+	});
+
+	describe('estimateTokensFallback', () => {
+		// Single-word lines, so the character ratio alone decides the estimate
+		test('should count diff lines at 3.8 characters per token', () => {
+			expect(estimateTokensFallback('+' + 'x'.repeat(379))).toBe(100);
+			expect(estimateTokensFallback('-' + 'x'.repeat(379))).toBe(100);
+			expect(estimateTokensFallback('@@' + 'x'.repeat(378))).toBe(100);
+		});
+
+		test('should ignore leading whitespace before diff markers', () => {
+			expect(estimateTokensFallback('  +' + 'x'.repeat(377))).toBe(100);
+		});
+
+		test('should count plain prose at 4.8 characters per token', () => {
+			expect(estimateTokensFallback('a'.repeat(480))).toBe(100);
+			expect(estimateTokensFallback('\t' + 'a'.repeat(478) + ' ')).toBe(100);
+		});
+
+		test('should count code at 4.2 characters per token', () => {
+			expect(estimateTokensFallback('{' + 'x'.repeat(419))).toBe(100);
+			expect(estimateTokensFallback('x'.repeat(419) + '=')).toBe(100);
+		});
+
+		test('should treat blank lines as neither diff nor prose', () => {
+			// The whitespace-only line counts as code; the prose line is still 0.9 of the text
+			expect(estimateTokensFallback('a'.repeat(387) + '\n' + ' '.repeat(42))).toBe(90);
+		});
+
+		test('should fall back to the word count for short words', () => {
+			expect(estimateTokensFallback('a b c d e f g h i j')).toBe(14);
+		});
+
+		test('should return 0 for empty text', () => {
+			expect(estimateTokensFallback('')).toBe(0);
+		});
 	});
 
 	describe('Token estimation accuracy', () => {